@@ -314,6 +314,7 @@ const ANALYTICS_MODEL_ALLOWLIST = new Set([
   // Transcription engines (SUPPORTED_WHISPER_MODELS + the parakeet path)
   'parakeet',
   'large-v3-turbo',
+  'large-v3-turbo-q8_0',
   // Common public cloud ids (cloud model fields are free-form per provider)
   'gpt-4o-mini',
   'gpt-4o',
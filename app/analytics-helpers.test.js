@@ -482,6 +482,7 @@ test('sanitizeModelForAnalytics keeps known public model ids but collapses custo
     'gpt-oss:20b',
     'parakeet',
     'large-v3-turbo',
+    'large-v3-turbo-q8_0',
     'gpt-4o-mini',
     'gpt-4o',
     'gpt-4.1-mini',
@@ -57,6 +57,7 @@ try:
 except ImportError:
     OllamaSummarizer = None
 
+from src import _json
 from src.language_detect import detect_transcript_language
 
 # Setup logging
@@ -195,7 +196,7 @@ def _normalize_markdown_for_parsing(md_text: str) -> str:
 # Markdown — re-exported here so existing imports keep working. The canonical
 # copies live in src.config because this module already imports from src (the
 # reverse import would be circular).
-from src.config import _atomic_write_json, _atomic_write_text  # noqa: E402
+from src.config import _atomic_write, _atomic_write_json, _atomic_write_text  # noqa: E402
 
 
 def _start_summary_heartbeat(label: str = "summarize", interval_s: int = 60, max_beats: int = 30):
@@ -939,7 +940,8 @@ def _append_segment_to_note(target: Path, new_text: str, duration_seconds):
                         pass
                     break
             fm_lines.append('notes_stale: true')
-            content = f"---\n{chr(10).join(fm_lines)}\n---{rest}"
+            frontmatter = '\n'.join(fm_lines)
+            content = f"---\n{frontmatter}\n---{rest}"
         # (A .md note without frontmatter shouldn't exist; append-only below.)
 
         # 2. Append to the Transcript section: insert before a trailing
@@ -953,8 +955,8 @@ def _append_segment_to_note(target: Path, new_text: str, duration_seconds):
             content = content.rstrip('\n') + segment + '\n'
         _atomic_write_text(target, content)
     else:
-        with open(target, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(target, 'rb') as f:
+            data = _json.loads(f.read())
         data['transcript'] = (data.get('transcript') or '').rstrip('\n') + segment
         si = data.setdefault('session_info', {})
         si['notes_stale'] = True
@@ -2274,8 +2276,16 @@ class _LiveVadPipeline:
         self.min_utterance_samples = int(sr * self.MIN_UTTERANCE_S)
         self.max_utterance_samples = int(sr * self.MAX_UTTERANCE_S)
 
-        # Mutable state for the run.
-        self.speech_samples = np.empty((0,), dtype=np.float32)
+        # Mutable state for the run. The in-progress utterance lives in one
+        # preallocated float32 buffer filled through a write index: appending
+        # each ~32 ms chunk with np.concatenate recopied the whole utterance
+        # every time (O(n²) over a 30 s monologue). Sized for the longest
+        # utterance plus a second of headroom for preroll and the chunk that
+        # crosses MAX_UTTERANCE_S; _append_speech grows it if that's ever short.
+        self._speech_buf = np.empty(
+            (self.max_utterance_samples + int(sr),), dtype=np.float32,
+        )
+        self._speech_len = 0
         self.speech_start_offset = 0
         self.last_partial_count = 0
         self.last_partial_text = ""
@@ -2310,13 +2320,11 @@ class _LiveVadPipeline:
 
         for ev in events:
             if isinstance(ev, self.SpeechStart):
-                preroll_audio = (
-                    self.np.concatenate(self.preroll) if self.preroll
-                    else self.np.empty((0,), dtype=self.np.float32)
-                )
-                self.speech_samples = preroll_audio
+                self._speech_len = 0
+                for pre in self.preroll:
+                    self._append_speech(pre)
                 self.speech_start_offset = max(
-                    0, self.cursor - len(chunk) - len(preroll_audio),
+                    0, self.cursor - len(chunk) - self._speech_len,
                 )
                 self.last_partial_count = 0
                 self.last_partial_text = ""
@@ -2324,7 +2332,7 @@ class _LiveVadPipeline:
                 self._finalise()
 
         if self.vad.in_speech:
-            self.speech_samples = self.np.concatenate([self.speech_samples, chunk])
+            self._append_speech(chunk)
             self.preroll = []
             if len(self.speech_samples) >= self.max_utterance_samples:
                 self._finalise()
@@ -2341,6 +2349,21 @@ class _LiveVadPipeline:
                 self.vad.in_speech, len(self.speech_samples),
             )
 
+    @property
+    def speech_samples(self):
+        """The in-progress utterance: a view onto the reusable buffer, valid
+        only until the next append or reset — copy it to keep it."""
+        return self._speech_buf[:self._speech_len]
+
+    def _append_speech(self, chunk):
+        end = self._speech_len + len(chunk)
+        if end > len(self._speech_buf):
+            grown = self.np.empty((max(end, 2 * len(self._speech_buf)),), dtype=self.np.float32)
+            grown[:self._speech_len] = self._speech_buf[:self._speech_len]
+            self._speech_buf = grown
+        self._speech_buf[self._speech_len:end] = chunk
+        self._speech_len = end
+
     def finalize(self):
         """Drain VAD on shutdown so a trailing utterance still emits.
 
@@ -2363,7 +2386,7 @@ class _LiveVadPipeline:
 
     def _finalise(self):
         if len(self.speech_samples) < self.min_utterance_samples:
-            self.speech_samples = self.np.empty((0,), dtype=self.np.float32)
+            self._speech_len = 0
             self.last_partial_count = 0
             self.last_partial_text = ""
             return
@@ -2374,7 +2397,7 @@ class _LiveVadPipeline:
             print("LIVE_ERROR:" + json.dumps({
                 "stage": "transcribe_final", "error": str(e),
             }), flush=True)
-            self.speech_samples = self.np.empty((0,), dtype=self.np.float32)
+            self._speech_len = 0
             self.last_partial_count = 0
             self.last_partial_text = ""
             return
@@ -2383,18 +2406,20 @@ class _LiveVadPipeline:
         # directly — it holds the segment briefly so a same-instant
         # utterance on the other channel can be checked for bleed before
         # either reaches the user (see _live_stdin_consumer).
+        # Copied: the coordinator holds the samples for its bleed-RMS check
+        # after this buffer has been reused for the next utterance.
         self.pending_finals.add(
             channel=self.speaker,
             text=text,
             start=self.speech_start_offset / self.sr,
             end=end_sample / self.sr,
-            samples=self.speech_samples,
+            samples=self.speech_samples.copy(),
         )
         # Advance the offset so a continued utterance (e.g. when
         # MAX_UTTERANCE_S forces a mid-monologue final) doesn't reuse the
         # just-emitted segment's start time on its next partial/final.
         self.speech_start_offset = end_sample
-        self.speech_samples = self.np.empty((0,), dtype=self.np.float32)
+        self._speech_len = 0
         self.last_partial_count = 0
         self.last_partial_text = ""
 
@@ -2587,6 +2612,9 @@ def test():
         try:
             from src.config import get_config
             transcriber = WhisperTranscriber(model_size=get_config().get_whisper_model())
+            # whisper.cpp loads on a worker thread; wait for it so a failed
+            # load is reported here instead of as "ready".
+            transcriber._await_model()
             print("✅ Whisper transcriber ready")
         except Exception as e:
             print(f"❌ Whisper initialization failed: {e}")
@@ -2781,6 +2809,107 @@ def _parse_meeting_markdown(md_path):
     }
 
 
+# Lazily created, shared by every listing in this process. I/O-bound workers,
+# so the cap is about disk queue depth rather than core count.
+_LISTING_MAX_WORKERS = 16
+_listing_executor = None
+
+
+def _get_listing_executor():
+    global _listing_executor
+    if _listing_executor is None:
+        from concurrent.futures import ThreadPoolExecutor
+        _listing_executor = ThreadPoolExecutor(
+            max_workers=_LISTING_MAX_WORKERS, thread_name_prefix="list-meetings"
+        )
+    return _listing_executor
+
+
+# Sidecar cache of the list payload, kept next to the summaries it describes.
+# Dot-prefixed so it never matches the *_summary.* globs. Bump the version
+# whenever the essential_meeting shape changes so stale entries are dropped.
+_MEETING_INDEX_NAME = ".meetings_index.json"
+_MEETING_INDEX_VERSION = 2
+
+
+def _load_meeting_index(index_path) -> dict:
+    """Return ``{path: [mtime_ns, ctime_ns, size, ino, sort_key, essential_meeting]}``.
+
+    A missing, corrupt or out-of-date index is just an empty cache — the
+    listing rebuilds it from the summary files.
+    """
+    try:
+        with open(index_path, 'rb') as f:
+            payload = _json.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("version") != _MEETING_INDEX_VERSION:
+        return {}
+    entries = payload.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+def _save_meeting_index(index_path, entries: dict) -> None:
+    """Persist the listing index atomically; failure only costs a re-parse."""
+    payload = {"version": _MEETING_INDEX_VERSION, "entries": entries}
+    try:
+        _atomic_write(
+            index_path,
+            lambda fh: json.dump(payload, fh, separators=(',', ':'), ensure_ascii=False),
+        )
+    except OSError as e:
+        logger.warning(f"Could not write meeting index {index_path}: {e}")
+
+
+# (key, default) pairs copied from a summary JSON into the list payload. The
+# transcript itself is deliberately absent — only has_transcript is sent. The
+# shared default containers are only ever serialised, never mutated.
+_LISTING_FIELDS = (
+    ("session_info", {}),
+    ("summary", ""),
+    ("participants", []),
+    ("discussion_areas", []),
+    ("key_points", []),
+    ("action_items", []),
+    ("is_diarised", False),
+    ("diarised_text", None),
+    ("folders", []),
+    ("user_notes", None),
+)
+
+
+def _load_meeting_for_listing(summary_file):
+    """Read one summary file into ``(sort_key, essential_meeting)``.
+
+    Returns None (after logging) when the file can't be read or parsed, so one
+    corrupt note never hides the rest of the list.
+    """
+    try:
+        if summary_file.suffix == '.md':
+            parsed = _parse_meeting_markdown(summary_file)
+            sort_key = parsed.get('session_info', {}).get('processed_at', '')
+            # Strip the transcript (and diarised copy) from the LIST payload
+            # to match the JSON path — the full text is fetched lazily by
+            # get-meeting for the detail page. Keep has_transcript so the UI
+            # still knows a transcript exists.
+            essential_meeting = parsed
+            essential_meeting['has_transcript'] = bool(parsed.get('transcript'))
+            essential_meeting.pop('transcript', None)
+            essential_meeting.pop('diarised_text', None)
+        else:
+            # Bytes straight into the parser: both orjson and json decode UTF-8
+            # as they scan, so a separate text-mode decode pass is pure overhead.
+            with open(summary_file, 'rb') as f:
+                data = _json.loads(f.read())
+            sort_key = data.get('session_info', {}).get('processed_at', '')
+            essential_meeting = {k: data.get(k, d) for k, d in _LISTING_FIELDS}
+            essential_meeting["has_transcript"] = bool(data.get("transcript"))
+        return sort_key, essential_meeting
+    except Exception as e:
+        logger.warning(f"Failed to load {summary_file}: {e}")
+        return None
+
+
 @cli.command()
 def list_meetings():
     """List all processed meetings - optimized for fast loading"""
@@ -2808,11 +2937,8 @@ def list_meetings():
     # so meetings stored before the path change remain visible
     custom = get_config().get_storage_path()
     if custom:
-        from src.config import is_bundled, get_user_data_dir
-        if is_bundled():
-            default_output = get_user_data_dir() / "output"
-        else:
-            default_output = Path(__file__).parent / "output"
+        from src.config import get_default_base_dir
+        default_output = get_default_base_dir() / "output"
         if default_output.exists():
             for pattern in ("*_summary.json", "*_summary.md"):
                 for f in default_output.glob(pattern):
@@ -2822,49 +2948,62 @@ def list_meetings():
                         seen_files.add(f.resolve())
                         seen_stems.add(stem)
 
+    # Only files whose stat stamp changed since the last listing are
+    # re-parsed; everything else comes straight from the sidecar index.
+    # mtime and size alone miss a same-size rewrite (moving a meeting between
+    # folders) on a filesystem with coarse mtimes. The inode catches it, since
+    # _atomic_write replaces the file, and ctime covers an in-place write.
+    # fresh_index only holds files seen in this pass, so entries for deleted
+    # or moved-away summaries are dropped when it is saved.
+    index_path = output_dir / _MEETING_INDEX_NAME
+    index = _load_meeting_index(index_path)
+    fresh_index = {}
     meetings = []
-
-    # Single-pass: read each file once, extract sort key and data together
+    misses = []
     for summary_file in summaries:
+        key = str(summary_file)
         try:
-            if summary_file.suffix == '.md':
-                parsed = _parse_meeting_markdown(summary_file)
-                sort_key = parsed.get('session_info', {}).get('processed_at', '')
-                # Strip the transcript (and diarised copy) from the LIST payload
-                # to match the JSON path — the full text is fetched lazily by
-                # get-meeting for the detail page. Keep has_transcript so the UI
-                # still knows a transcript exists.
-                essential_meeting = parsed
-                essential_meeting['has_transcript'] = bool(parsed.get('transcript'))
-                essential_meeting.pop('transcript', None)
-                essential_meeting.pop('diarised_text', None)
-            else:
-                with open(summary_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    sort_key = data.get('session_info', {}).get('processed_at', '')
-                    essential_meeting = {
-                        "session_info": data.get("session_info", {}),
-                        "summary": data.get("summary", ""),
-                        "participants": data.get("participants", []),
-                        "discussion_areas": data.get("discussion_areas", []),
-                        "key_points": data.get("key_points", []),
-                        "action_items": data.get("action_items", []),
-                        "has_transcript": bool(data.get("transcript")),
-                        "is_diarised": data.get("is_diarised", False),
-                        "diarised_text": data.get("diarised_text"),
-                        "folders": data.get("folders", []),
-                        "user_notes": data.get("user_notes"),
-                    }
-            meetings.append((sort_key, essential_meeting))
-        except Exception as e:
-            logger.warning(f"Failed to load {summary_file}: {e}")
+            st = summary_file.stat()
+        except OSError:
             continue
+        stamp = (st.st_mtime_ns, st.st_ctime_ns, st.st_size, st.st_ino)
+        cached = index.get(key)
+        if cached is not None and tuple(cached[:4]) == stamp:
+            fresh_index[key] = cached
+            meetings.append((cached[4], cached[5]))
+        else:
+            misses.append((summary_file, stamp))
+
+    # Fan the per-file read+parse out across a thread pool: on a cold cache the
+    # listing is dominated by open()/read() latency, not parsing, so overlapping
+    # the syscalls is close to free. map() yields in submission order.
+    if misses:
+        loaded_all = _get_listing_executor().map(
+            _load_meeting_for_listing, [f for f, _ in misses]
+        )
+        for (summary_file, stamp), loaded in zip(misses, loaded_all):
+            if loaded is not None:
+                fresh_index[str(summary_file)] = [*stamp, loaded[0], loaded[1]]
+                meetings.append(loaded)
+
+    if fresh_index != index:
+        _save_meeting_index(index_path, fresh_index)
 
     meetings.sort(key=lambda x: x[0], reverse=True)
-    meetings = [m for _, m in meetings]
-    
-    # Output as compact JSON for Electron (no indentation for speed)
-    print(json.dumps(meetings, separators=(',', ':')))
+
+    # Output as compact JSON for Electron (no indentation for speed), one
+    # meeting at a time so peak memory is a single entry's string rather than
+    # the whole serialised list. Stays ASCII-escaped: runPythonScript decodes
+    # each pipe chunk independently, so a multi-byte UTF-8 sequence split
+    # across chunks would be corrupted.
+    out = sys.stdout
+    out.write('[')
+    for i, (_, meeting) in enumerate(meetings):
+        if i:
+            out.write(',')
+        out.write(json.dumps(meeting, separators=(',', ':')))
+    out.write(']\n')
+    out.flush()
 
 
 @cli.command()
@@ -2892,8 +3031,8 @@ def reprocess(summary_file, regenerate_title, retranscribe):
         if summary_path.suffix == '.md':
             existing_data = _parse_meeting_markdown(summary_path)
         else:
-            with open(summary_path, 'r') as f:
-                existing_data = json.load(f)
+            with open(summary_path, 'rb') as f:
+                existing_data = _json.loads(f.read())
 
         # Re-transcribe (#266): re-run ASR on the ORIGINAL recording with the
         # CURRENT global engine/model/language settings, then fall through into
@@ -3333,8 +3472,8 @@ def regen_title(summary_file):
         if summary_path.suffix == '.md':
             existing_data = _parse_meeting_markdown(summary_path)
         else:
-            with open(summary_path, 'r') as f:
-                existing_data = json.load(f)
+            with open(summary_path, 'rb') as f:
+                existing_data = _json.loads(f.read())
 
         transcript = existing_data.get('transcript', '')
         summary = existing_data.get('summary', '')
@@ -3410,8 +3549,8 @@ def query(transcript_file, question):
             return
 
         try:
-            with open(transcript_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(transcript_path, 'rb') as f:
+                data = _json.loads(f.read())
                 transcript_text = data.get('transcript', '')
                 if not transcript_text:
                     print(json.dumps({"success": False, "error": "No transcript found in summary file"}))
@@ -3511,8 +3650,8 @@ def query_streaming(transcript_file, question):
             print(f"STREAM_ERROR:File not found: {transcript_file}", flush=True)
             return
         try:
-            with open(transcript_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(transcript_path, 'rb') as f:
+                data = _json.loads(f.read())
                 transcript_text = data.get('transcript', '')
                 if not transcript_text:
                     print("STREAM_ERROR:No transcript found in summary file", flush=True)
@@ -3630,8 +3769,8 @@ def chat_global_streaming(question, folder):
         if f.stem.replace('_summary', '') in seen:
             continue
         try:
-            with open(f, 'r', encoding='utf-8') as fh:
-                summaries.append((f, json.load(fh)))
+            with open(f, 'rb') as fh:
+                summaries.append((f, _json.loads(fh.read())))
         except (OSError, ValueError):
             continue
 
@@ -3738,11 +3877,8 @@ def list_failed():
         seen_files.add(f.resolve())
     custom = get_config().get_storage_path()
     if custom:
-        from src.config import is_bundled, get_user_data_dir
-        if is_bundled():
-            default_output = get_user_data_dir() / "output"
-        else:
-            default_output = Path(__file__).parent / "output"
+        from src.config import get_default_base_dir
+        default_output = get_default_base_dir() / "output"
         if default_output.exists():
             for f in default_output.glob("*_summary.json"):
                 if f.resolve() not in seen_files:
@@ -3752,8 +3888,8 @@ def list_failed():
     
     for summary_file in summaries:
         try:
-            with open(summary_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(summary_file, 'rb') as f:
+                data = _json.loads(f.read())
                 
                 # Check for signs of failed processing
                 summary_text = data.get("summary", "")
@@ -3801,7 +3937,6 @@ def clear_state():
               help='Emit a single machine-readable JSON object instead of the human-readable report.')
 def setup_check(as_json):
     """Check system setup and dependencies"""
-    import subprocess
     import sys
     import os
 
@@ -3846,12 +3981,17 @@ def setup_check(as_json):
     except Exception as e:
         checks.append(("❌ Ollama", f"Error: {e}"))
     
-    # Check ffmpeg (bundled locations first, then system)
+    # Check ffmpeg (bundled locations first, then system). Candidates are
+    # stat-checked (exists + executable bit) and only the first hit is
+    # exec'd, once, with `-version` — so a broken binary isn't reported as
+    # working, without paying a process launch (and a code-signature check on
+    # macOS) per candidate, as the transcriber's _resolve_ffmpeg does.
     try:
-        ffmpeg_found = False
-        possible_ffmpeg_paths = []
+        import shutil
+        import subprocess
         ffmpeg_exe_suffix = ".exe" if sys.platform == "win32" else ""
         ffmpeg_binary = f"ffmpeg{ffmpeg_exe_suffix}"
+        possible_ffmpeg_paths = []
 
         # Check bundled ffmpeg (PyInstaller bundle)
         if getattr(sys, 'frozen', False):
@@ -3860,10 +4000,11 @@ def setup_check(as_json):
                 exe_dir / ffmpeg_binary,                # bundle root (stenoai.spec places it at '.')
                 exe_dir / '_internal' / ffmpeg_binary,  # _internal subdirectory
             ]:
-                if candidate.exists():
-                    possible_ffmpeg_paths.append(('bundled', str(candidate)))
+                possible_ffmpeg_paths.append(('bundled', str(candidate)))
 
-        possible_ffmpeg_paths.append((None, 'ffmpeg'))  # PATH (Windows resolves via PATHEXT)
+        on_path = shutil.which('ffmpeg')  # Windows resolves via PATHEXT
+        if on_path:
+            possible_ffmpeg_paths.append((None, on_path))
         if sys.platform != "win32":
             possible_ffmpeg_paths.extend([
                 (None, '/opt/homebrew/bin/ffmpeg'),     # Homebrew Apple Silicon
@@ -3871,18 +4012,26 @@ def setup_check(as_json):
                 (None, '/usr/bin/ffmpeg'),              # System
             ])
 
-        for label, path in possible_ffmpeg_paths:
+        ffmpeg_hit = next(
+            ((label, path) for label, path in possible_ffmpeg_paths
+             if os.path.isfile(path) and os.access(path, os.X_OK)),
+            None,
+        )
+        ffmpeg_runs = False
+        if ffmpeg_hit:
             try:
-                result = subprocess.run([path, '-version'],
-                                      capture_output=True, timeout=5)
-                if result.returncode == 0:
-                    checks.append(("✅ ffmpeg", label or f"found at {path}"))
-                    ffmpeg_found = True
-                    break
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                continue
+                result = subprocess.run([ffmpeg_hit[1], '-version'],
+                                        capture_output=True, timeout=5)
+                ffmpeg_runs = result.returncode == 0
+            except (OSError, subprocess.TimeoutExpired):
+                pass
 
-        if not ffmpeg_found:
+        if ffmpeg_runs:
+            label, path = ffmpeg_hit
+            checks.append(("✅ ffmpeg", label or f"found at {path}"))
+        elif ffmpeg_hit:
+            checks.append(("❌ ffmpeg", f"{ffmpeg_hit[1]} failed to run"))
+        else:
             install_hint = (
                 "winget install Gyan.FFmpeg" if sys.platform == "win32"
                 else "brew install ffmpeg"
@@ -3895,37 +4044,28 @@ def setup_check(as_json):
     # Just verify Ollama binary is installed
     # The model will be downloaded during setup if needed
     
-    # Check Python dependencies
-    try:
-        import sounddevice
+    # Check Python dependencies. find_spec locates each package without
+    # executing it — importing them here would pay their full module init
+    # (native library loads, openai-whisper's torch import) just to report
+    # that they exist.
+    from importlib.util import find_spec
+
+    if find_spec("sounddevice") is not None:
         checks.append(("✅ sounddevice", "audio recording"))
-    except ImportError:
+    else:
         checks.append(("❌ sounddevice", "pip install sounddevice"))
-    
+
     # Check for whisper backend (prefer pywhispercpp, fallback to openai-whisper)
-    whisper_found = False
-    try:
-        import pywhispercpp
+    if find_spec("pywhispercpp") is not None:
         checks.append(("✅ whisper", "pywhispercpp (fast)"))
-        whisper_found = True
-    except ImportError:
-        pass
-
-    if not whisper_found:
-        try:
-            import whisper
-            checks.append(("✅ whisper", "openai-whisper"))
-            whisper_found = True
-        except ImportError:
-            pass
-
-    if not whisper_found:
+    elif find_spec("whisper") is not None:
+        checks.append(("✅ whisper", "openai-whisper"))
+    else:
         checks.append(("❌ whisper", "pip install pywhispercpp"))
-    
-    try:
-        import ollama
+
+    if find_spec("ollama") is not None:
         checks.append(("✅ ollama-python", "LLM client"))
-    except ImportError:
+    else:
         checks.append(("❌ ollama-python", "pip install ollama"))
 
     # Check if whisper model is downloaded. pywhispercpp uses platformdirs, so
@@ -4071,7 +4211,7 @@ def list_models():
             }
     else:
         # Per-entry dicts must be copied, not mutated in place: list_supported_models()
-        # returns a shallow copy whose nested dicts are the SAME objects as
+        # returns a read-only view whose nested dicts are the SAME objects as
         # Config.SUPPORTED_MODELS. Mutating them directly would leak 'installed' /
         # 'mlx_tag' / 'mlx_installed' into the class-level dict, contaminating any
         # later call within the same process (e.g. repeated invocations in tests).
@@ -5084,6 +5224,10 @@ def check_model(model_name):
             print(json.dumps({"installed": False, "model": model_name, "error": str(e)}))
 
 
+# Matches PROGRESS_THROTTLE_MS in main.js's pull-model handler.
+_PULL_PROGRESS_INTERVAL_S = 0.2
+
+
 @cli.command()
 @click.argument('model_name')
 def pull_model(model_name):
@@ -5101,14 +5245,23 @@ def pull_model(model_name):
         # same blob.
         seen_statuses = set()
         blob_index = 0
+        # Ollama streams many ticks per second on a multi-GB blob, but
+        # main.js forwards at most one every 200ms. Print a blob's first and
+        # final tick and otherwise at that cadence, so the rest never cost a
+        # format + flushed pipe write + debug-log line on the Electron side.
+        last_printed = 0.0
         for progress in ollama.pull(model_name, stream=True):
             status = getattr(progress, 'status', '') or ''
             total = getattr(progress, 'total', 0) or 0
             completed = getattr(progress, 'completed', 0) or 0
             if total > 0:
+                now = time.monotonic()
                 if status not in seen_statuses:
                     seen_statuses.add(status)
                     blob_index += 1
+                elif completed < total and now - last_printed < _PULL_PROGRESS_INTERVAL_S:
+                    continue
+                last_printed = now
                 pct = int(completed / total * 100)
                 # Byte counts and the blob/part index are appended in a
                 # machine-parseable suffix, on the SAME line as the
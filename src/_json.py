@@ -0,0 +1,33 @@
+"""JSON parsing through orjson, with a stdlib fallback.
+
+orjson parses the summary/sidecar JSON several times faster than the stdlib
+decoder and accepts ``bytes`` directly, so callers can skip a separate UTF-8
+decode pass. It is listed in requirements.txt and bundled with the app; the
+import stays guarded so an environment that predates the requirement falls
+back to ``json`` instead of failing to start.
+
+Only parsing goes through here. Output that reaches Electron over stdout stays
+on ``json.dumps`` — orjson has no ``ensure_ascii`` and always emits raw UTF-8,
+which app/backend-cli.js would corrupt when a multi-byte character straddles
+two pipe chunks.
+
+``orjson.JSONDecodeError`` subclasses ``json.JSONDecodeError``, so callers
+catch the same ``ValueError`` either way.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # stale dev environment
+    orjson = None
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """Parse a JSON document from ``str`` or UTF-8 ``bytes``."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
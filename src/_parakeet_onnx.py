@@ -27,7 +27,9 @@ A few intentional differences from the MLX path:
 
 from __future__ import annotations
 
+import inspect
 import logging
+import os
 import re
 import threading
 from dataclasses import dataclass
@@ -73,6 +75,12 @@ PARAKEET_CHUNK_OVERLAP_S = 15.0
 # treated as the same token re-emitted in the overlap, not a new one.
 _DEDUPE_EPSILON_S = 0.1
 
+# ORT's default intra-op pool is one thread per physical core. Live partials
+# decode every ~400 ms while the audio callbacks, Silero VAD and Electron share
+# the same CPU, so an all-cores pool starves capture exactly when it matters.
+# Same cores-minus-two budget whisper.cpp gets in src.transcriber.
+_INTRA_OP_THREADS = max(1, (os.cpu_count() or 1) - 2)
+
 # (text-only, with-timestamps) pair, keyed by model_id. Two adapter objects
 # wrap the same underlying ORT session — onnx-asr's adapter is lightweight,
 # the heavy weight lives in the session. Avoiding a single adapter means we
@@ -120,17 +128,37 @@ def _load_model(model_id: str) -> tuple[Any, Any]:
                 "in the venv (dev) or rebuild the PyInstaller bundle (prod)."
             ) from e
         logger.info("Loading Parakeet (ONNX) model: %s [int8, CPU]", model_id)
-        text_model = onnx_asr.load_model(
-            _ONNX_ASR_ALIAS,
-            quantization=_QUANTIZATION,
-            providers=["CPUExecutionProvider"],
-        )
+        load_kwargs = {
+            "quantization": _QUANTIZATION,
+            "providers": ["CPUExecutionProvider"],
+        }
+        sess_options = _session_options(onnx_asr.load_model)
+        if sess_options is not None:
+            load_kwargs["sess_options"] = sess_options
+        text_model = onnx_asr.load_model(_ONNX_ASR_ALIAS, **load_kwargs)
         ts_model = text_model.with_timestamps()
         _MODEL_CACHE[model_id] = (text_model, ts_model)
         logger.info("Parakeet (ONNX) model loaded")
         return _MODEL_CACHE[model_id]
 
 
+def _session_options(load_model) -> Optional[Any]:
+    """ORT SessionOptions capping the intra-op pool, or None to use defaults.
+
+    Probed by signature so an onnx-asr without ``sess_options`` degrades to
+    ORT's default pool rather than a TypeError at model load.
+    """
+    try:
+        if "sess_options" not in inspect.signature(load_model).parameters:
+            return None
+        import onnxruntime as ort
+    except (TypeError, ValueError, ImportError):
+        return None
+    sess_options = ort.SessionOptions()
+    sess_options.intra_op_num_threads = _INTRA_OP_THREADS
+    return sess_options
+
+
 def model_sample_rate(model_id: str = DEFAULT_MODEL_ID) -> int:
     """Sample rate the model expects (used to configure the mic + VAD).
 
@@ -439,10 +467,19 @@ def _load_wav_16k_mono(audio_path: Path):
 
     if not raw:
         return None
-    samples = np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
+    pcm = np.frombuffer(raw, dtype=np.int16)
     if n_channels > 1:
-        # Interleaved frames → average channels down to mono.
-        samples = samples.reshape(-1, n_channels).mean(axis=1)
+        # Interleaved frames → average channels down to mono straight from the
+        # int16 view, so only the mono float32 result is ever allocated rather
+        # than a full interleaved float32 copy (2x the channel count's worth).
+        samples = pcm.reshape(-1, n_channels).mean(axis=1, dtype=np.float32)
+    else:
+        samples = pcm.astype(np.float32)
+    del pcm, raw
+    # Scaled in place — ``astype(...) / 32768.0`` materialised a second
+    # full-length float array (~230 MB per hour of 16 kHz audio) just to hold
+    # the quotient. 1/32768 is a power of two, so the result is bit-identical.
+    samples *= 1.0 / 32768.0
     return samples
 
 
@@ -13,13 +13,16 @@ import re
 import shutil
 import sys
 import tempfile
+import threading
 import time
 import uuid
 from pathlib import Path
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping
 
 import filelock
 
+from src import _json
 from src.whisper_models import SUPPORTED_WHISPER_MODELS as _WHISPER_REGISTRY
 from src import templates as _templates
 
@@ -103,8 +106,13 @@ def _atomic_write_json(path: Path, payload) -> None:
     truncate-and-rewrite lets a reader see a torn file, fall back to
     defaults, and (pre-fix) persist those defaults over the user's real
     settings. See _atomic_write for the durability mechanics.
+
+    The payload is serialized before the temp file is opened, so an
+    unserializable value fails without touching the disk and the file is
+    written in one call rather than json.dump's write per token.
     """
-    _atomic_write(path, lambda fh: json.dump(payload, fh, indent=2))
+    text = json.dumps(payload, indent=2)
+    _atomic_write(path, lambda fh: fh.write(text))
 
 
 def _atomic_write_text(path: Path, text: str, encoding: str = 'utf-8') -> None:
@@ -145,6 +153,15 @@ def get_user_data_dir() -> Path:
     return (Path(base) if base else Path.home() / ".local" / "share") / "stenoai"
 
 
+# This module's install location never changes for the life of the process,
+# so the legacy path-substring half of is_bundled() is decided once at import
+# rather than re-stringifying __file__ on every Config() / get_data_dirs().
+_MODULE_PATH_STR = str(Path(__file__))
+_INSTALLED_UNDER_APPLICATIONS = (
+    "StenoAI.app" in _MODULE_PATH_STR or "Applications" in _MODULE_PATH_STR
+)
+
+
 def is_bundled() -> bool:
     """True when running from a PyInstaller-frozen bundle.
 
@@ -152,10 +169,21 @@ def is_bundled() -> bool:
     net; sys.frozen is the canonical PyInstaller marker on every platform, with
     the path check kept as a belt-and-braces for mac-source-in-Applications.
     """
-    if getattr(sys, "frozen", False):
-        return True
-    path = str(Path(__file__))
-    return "StenoAI.app" in path or "Applications" in path
+    return bool(getattr(sys, "frozen", False)) or _INSTALLED_UNDER_APPLICATIONS
+
+
+def get_default_base_dir() -> Path:
+    """Root of recordings/, transcripts/ and output/ when no custom
+    storage_path is set — also where config.json lives.
+
+    The per-OS user data dir when bundled (or under STENOAI_USER_DATA_DIR e2e
+    isolation, which forces it even from source), otherwise the repo root for
+    source dev. The one place this decision is made; get_data_dirs(), Config
+    and the CLI's "also scan the default location" fallbacks all call it.
+    """
+    if is_bundled() or os.environ.get("STENOAI_USER_DATA_DIR"):
+        return get_user_data_dir()
+    return Path(__file__).parent.parent
 
 
 def is_apple_silicon() -> bool:
@@ -177,8 +205,9 @@ class Config:
     # tucks deprecated entries into a collapsed, dimmed section and only surfaces
     # one if it's still the user's current model. Deprecated (rather than removed)
     # so a user already on the model keeps a recognised selection; fully retired
-    # models are dropped from this dict.
-    SUPPORTED_MODELS = {
+    # models are dropped from this dict. Read-only: list_supported_models()
+    # hands out this proxy directly rather than a fresh copy per call.
+    SUPPORTED_MODELS = MappingProxyType({
         "gemma4:e2b-it-qat": {
             "name": "Gemma 4 E2B (QAT)",
             "size": "4.3GB",
@@ -228,7 +257,7 @@ class Config:
             "speed": "medium",
             "quality": "excellent"
         },
-    }
+    })
 
 
     # Single source of truth for the curated Whisper model lineup is
@@ -298,15 +327,7 @@ class Config:
             config_path: Path to config file. If None, uses default location.
         """
         if config_path is None:
-            # STENOAI_USER_DATA_DIR forces the data dir even from source (e2e
-            # isolation), so the override in get_user_data_dir() is authoritative
-            # whether the backend runs frozen or from source.
-            if is_bundled() or os.environ.get("STENOAI_USER_DATA_DIR"):
-                base_dir = get_user_data_dir()
-            else:
-                # Source dev: project root
-                base_dir = Path(__file__).parent.parent
-
+            base_dir = get_default_base_dir()
             base_dir.mkdir(parents=True, exist_ok=True)
             self.config_path = base_dir / "config.json"
         else:
@@ -327,14 +348,25 @@ class Config:
         # back ONLY the keys this process actually changed, so a concurrent
         # writer's unrelated keys aren't clobbered (the lost-update fix).
         self._snapshot: Dict[str, Any] = copy.deepcopy(self._config)
-        self._migrate_cloud_model_map()
-        self._migrate_whisper_model()
-        self._migrate_summary_model()
-        self._migrate_transcription_engine()
-        self._migrate_language_zh()
-        self._migrate_privacy_notice_seen()
-        self._normalize_templates()
-        self._seed_sample_template()
+        # Each migration below persists its own change, and a fresh or
+        # long-unupgraded install can trip several of them in one load. Defer
+        # their _save() calls and write once at the end: one lock + fsync +
+        # rename per CLI process instead of one per migration.
+        self._defer_saves = True
+        self._save_pending = False
+        try:
+            self._migrate_cloud_model_map()
+            self._migrate_whisper_model()
+            self._migrate_summary_model()
+            self._migrate_transcription_engine()
+            self._migrate_language_zh()
+            self._migrate_privacy_notice_seen()
+            self._normalize_templates()
+            self._seed_sample_template()
+        finally:
+            self._defer_saves = False
+        if self._save_pending:
+            self._save()
 
     def _migrate_language_zh(self) -> None:
         """Migrate the legacy single ``"zh"`` language to Simplified (``zh-Hans``).
@@ -430,9 +462,9 @@ class Config:
     def _migrate_whisper_model(self) -> None:
         """Map any out-of-current-list whisper model to the supported one.
 
-        The curated lineup is now a single tier (large-v3-turbo), so any
-        previously-supported but now-retired tier (tiny/base/small/medium/
-        large/large-v3) migrates to it.
+        The curated lineup is now large-v3-turbo (plus its 8-bit quantised
+        build), so any previously-supported but now-retired tier (tiny/base/
+        small/medium/large/large-v3) migrates to large-v3-turbo.
         """
         if self._load_failed:
             return  # never persist defaults over a corrupt-but-recoverable file
@@ -540,8 +572,8 @@ class Config:
         last_error = None
         for attempt in range(2):
             try:
-                with open(self.config_path, 'r') as f:
-                    config = json.load(f)
+                with open(self.config_path, 'rb') as f:
+                    config = _json.loads(f.read())
                     if not isinstance(config, dict):
                         # `null` / `[]` parse fine but crash every get/set
                         # later; route them through the corrupt-file path.
@@ -583,8 +615,8 @@ class Config:
         if not self.config_path.exists():
             return None
         try:
-            with open(self.config_path, 'r') as f:
-                data = json.load(f)
+            with open(self.config_path, 'rb') as f:
+                data = _json.loads(f.read())
         except Exception:
             return None
         return data if isinstance(data, dict) else None
@@ -656,7 +688,13 @@ class Config:
         as the merge base and overlay only the top-level keys this process
         changed. On lock timeout, degrade to a plain unlocked atomic write of
         our own config — a stuck lock must never block saves or raise.
+
+        While the load-time migrations run, saves are only recorded and
+        __init__ writes once after the last of them.
         """
+        if self._defer_saves:
+            self._save_pending = True
+            return True
         lock_path = str(self.config_path) + ".lock"
         try:
             # filelock is NOT reentrant: _save() must never be called while
@@ -949,9 +987,12 @@ class Config:
         """
         return self.SUPPORTED_MODELS.get(model_name)
 
-    def list_supported_models(self) -> Dict[str, Dict[str, str]]:
-        """Get all supported models with their metadata."""
-        return self.SUPPORTED_MODELS.copy()
+    def list_supported_models(self) -> Mapping[str, Dict[str, str]]:
+        """Get all supported models with their metadata (read-only view).
+
+        Callers that decorate entries must copy them first, as list_models does.
+        """
+        return self.SUPPORTED_MODELS
 
     def get_notifications_enabled(self) -> bool:
         """Get whether desktop notifications are enabled."""
@@ -1606,13 +1647,20 @@ class Config:
 
 # Global config instance
 _config_instance: Optional[Config] = None
+_config_instance_lock = threading.Lock()
 
 
 def get_config() -> Config:
-    """Get the global config instance (singleton pattern)."""
+    """Get the global config instance (singleton pattern).
+
+    Double-checked under a lock so threads racing on first use share one
+    Config instead of each re-reading and migrating config.json.
+    """
     global _config_instance
     if _config_instance is None:
-        _config_instance = Config()
+        with _config_instance_lock:
+            if _config_instance is None:
+                _config_instance = Config()
     return _config_instance
 
 
@@ -1635,10 +1683,8 @@ def get_data_dirs() -> Dict[str, Path]:
         base = get_user_data_dir()
     elif custom:
         base = Path(custom)
-    elif is_bundled():
-        base = get_user_data_dir()
     else:
-        base = Path(__file__).parent.parent  # project root in dev (source)
+        base = get_default_base_dir()
 
     dirs = {
         "recordings": base / "recordings",
@@ -7,14 +7,15 @@ Meeting-to-folder assignment is stored in each meeting's summary JSON.
 
 import json
 import logging
+import secrets
 import shutil
-import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
 import filelock
 
+from src import _json
 from src.config import _atomic_write_json, _atomic_write_text
 
 logger = logging.getLogger(__name__)
@@ -58,8 +59,8 @@ class FoldersManager:
         if not self.folders_file.exists():
             return self._empty()
         try:
-            with open(self.folders_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(self.folders_file, "rb") as f:
+                data = _json.loads(f.read())
         except json.JSONDecodeError as e:
             self._quarantine_corrupt(e)
             return self._empty()
@@ -155,7 +156,7 @@ class FoldersManager:
     def create_folder(self, name: str, color: str = "#6366f1") -> Optional[Dict]:
         def _mutate(data: Dict) -> Dict:
             folder = {
-                "id": str(uuid.uuid4())[:8],
+                "id": secrets.token_hex(4),
                 "name": name,
                 "color": color,
                 "icon": "folder",
@@ -167,23 +168,36 @@ class FoldersManager:
 
         return self._update(_mutate)
 
+    @staticmethod
+    def _folder_index(data: Dict, folder_id: str) -> Optional[int]:
+        """Position of `folder_id` in the freshly read list, or None.
+
+        Every mutation works on a list just re-read under the lock, so a
+        long-lived id index would be stale by the next call; a single scan
+        that stops at the first match is the cheapest correct lookup.
+        """
+        return next(
+            (i for i, f in enumerate(data["folders"]) if f["id"] == folder_id),
+            None,
+        )
+
     def update_icon(self, folder_id: str, icon: str) -> bool:
         def _mutate(data: Dict) -> Optional[bool]:
-            for folder in data["folders"]:
-                if folder["id"] == folder_id:
-                    folder["icon"] = icon
-                    return True
-            return None  # unknown id: nothing to write
+            i = self._folder_index(data, folder_id)
+            if i is None:
+                return None  # unknown id: nothing to write
+            data["folders"][i]["icon"] = icon
+            return True
 
         return self._update(_mutate) is True
 
     def rename_folder(self, folder_id: str, name: str) -> bool:
         def _mutate(data: Dict) -> Optional[bool]:
-            for folder in data["folders"]:
-                if folder["id"] == folder_id:
-                    folder["name"] = name
-                    return True
-            return None  # unknown id: nothing to write
+            i = self._folder_index(data, folder_id)
+            if i is None:
+                return None  # unknown id: nothing to write
+            data["folders"][i]["name"] = name
+            return True
 
         return self._update(_mutate) is True
 
@@ -237,6 +251,10 @@ class FoldersManager:
                     current = []
 
             updated = update_fn(current)
+            if m and updated == current:
+                # Already (or still not) a member: rewriting the whole note
+                # to produce the same frontmatter line is pure I/O.
+                return True
             folders_line = f'folders: {json.dumps(updated)}'
 
             if m:
@@ -256,17 +274,16 @@ class FoldersManager:
         """Add a folder reference to a meeting's summary file."""
         if summary_path.suffix == '.md':
             return self._update_md_folders(
-                summary_path, lambda f: list({*f, folder_id})
+                summary_path, lambda f: f if folder_id in f else [*f, folder_id]
             )
         try:
-            with open(summary_path, "r") as f:
-                data = json.load(f)
+            with open(summary_path, "rb") as f:
+                data = _json.loads(f.read())
             folders = data.get("folders", [])
             if folder_id not in folders:
                 folders.append(folder_id)
                 data["folders"] = folders
-                with open(summary_path, "w") as f:
-                    json.dump(data, f, indent=2)
+                _atomic_write_json(summary_path, data)
             return True
         except Exception as e:
             logger.error(f"Error adding meeting to folder: {e}")
@@ -279,14 +296,13 @@ class FoldersManager:
                 summary_path, lambda f: [x for x in f if x != folder_id]
             )
         try:
-            with open(summary_path, "r") as f:
-                data = json.load(f)
+            with open(summary_path, "rb") as f:
+                data = _json.loads(f.read())
             folders = data.get("folders", [])
             if folder_id in folders:
                 folders.remove(folder_id)
                 data["folders"] = folders
-                with open(summary_path, "w") as f:
-                    json.dump(data, f, indent=2)
+                _atomic_write_json(summary_path, data)
             return True
         except Exception as e:
             logger.error(f"Error removing meeting from folder: {e}")
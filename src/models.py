@@ -27,21 +27,21 @@ class MeetingTranscript(BaseModel):
     duration: str
     overview: str
     participants: List[str]
-    discussion_areas: List[DiscussionArea] = []  # New field - optional for backwards compatibility
+    discussion_areas: List[DiscussionArea] = Field(default_factory=list)  # New field - optional for backwards compatibility
     key_points: List[Decision]
     next_steps: List[ActionItem]
     transcript: str
 
     def to_json_file(self, filepath: str) -> None:
         """Save the meeting transcript to a JSON file."""
-        import json
-        with open(filepath, 'w') as f:
-            json.dump(self.model_dump(), f, indent=2)
+        # pydantic-core serializes straight to JSON, skipping the model_dump()
+        # dict; encoding before opening means a failure can't truncate the file.
+        data = self.model_dump_json(indent=2).encode('utf-8')
+        with open(filepath, 'wb') as f:
+            f.write(data)
 
     @classmethod
     def from_json_file(cls, filepath: str) -> 'MeetingTranscript':
         """Load a meeting transcript from a JSON file."""
-        import json
-        with open(filepath, 'r') as f:
-            data = json.load(f)
-        return cls(**data)
\ No newline at end of file
+        with open(filepath, 'rb') as f:
+            return cls.model_validate_json(f.read())
\ No newline at end of file
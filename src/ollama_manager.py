@@ -5,9 +5,11 @@ Handles finding and running the bundled Ollama binary that ships with StenoAI,
 eliminating the need for users to install Ollama separately.
 """
 
+import functools
 import logging
 import os
 import shutil
+import socket
 import subprocess
 import sys
 import time
@@ -23,10 +25,14 @@ _EXE_SUFFIX = ".exe" if sys.platform == "win32" else ""
 OLLAMA_DOWNLOAD_URL = "https://github.com/ollama/ollama/releases/download/v0.16.3/ollama-darwin.tgz"
 
 
+@functools.lru_cache(maxsize=1)
 def get_bundled_ollama_dir() -> Optional[Path]:
     """
     Get the path to the bundled Ollama directory.
 
+    The bundle layout can't change under a running process, so the probe
+    runs once; get_ollama_env() and binary discovery reuse the result.
+
     Returns:
         Path to the ollama directory, or None if not found
     """
@@ -54,6 +60,12 @@ def get_bundled_ollama_dir() -> Optional[Path]:
     return None
 
 
+# Resolved binary, remembered for the rest of the process so setup-check and
+# the summarizer (and every retry inside it) share one discovery. Not cached
+# when nothing was found, so an install made mid-session is still picked up.
+_resolved_ollama_binary: Optional[Path] = None
+
+
 def get_ollama_binary() -> Optional[Path]:
     """
     Get the path to the Ollama binary.
@@ -62,9 +74,23 @@ def get_ollama_binary() -> Optional[Path]:
     1. Bundled Ollama (in PyInstaller bundle or dev bin/)
     2. System Ollama (in PATH or common locations)
 
+    The first hit is memoized per process and re-validated with a single
+    access() call, so a binary that disappears (app update, brew uninstall)
+    falls through to a fresh probe instead of being handed out stale.
+
     Returns:
         Path to ollama binary, or None if not found
     """
+    global _resolved_ollama_binary
+    cached = _resolved_ollama_binary
+    if cached is not None and os.access(cached, os.X_OK):
+        return cached
+    _resolved_ollama_binary = _discover_ollama_binary()
+    return _resolved_ollama_binary
+
+
+def _discover_ollama_binary() -> Optional[Path]:
+    """Probe the bundled, PATH and well-known install locations (uncached)."""
     binary_name = f"ollama{_EXE_SUFFIX}"
 
     # Check bundled first
@@ -108,13 +134,21 @@ def get_ollama_env() -> dict:
     """
     Get environment variables needed to run bundled Ollama.
 
-    Sets up library paths for the bundled dylibs.
+    Sets up library paths for the bundled dylibs and the server's
+    KV-cache defaults.
 
     Returns:
         Dictionary of environment variables
     """
     env = os.environ.copy()
 
+    # Server defaults for an instance we launch; a value the user already set
+    # wins. q8_0 halves KV-cache memory, which is most of what the large
+    # num_ctx windows we request cost, at no noticeable quality loss; Ollama
+    # only quantizes the KV cache with flash attention on.
+    env.setdefault('OLLAMA_FLASH_ATTENTION', '1')
+    env.setdefault('OLLAMA_KV_CACHE_TYPE', 'q8_0')
+
     bundled_dir = get_bundled_ollama_dir()
     if bundled_dir:
         ollama_dir_str = str(bundled_dir)
@@ -151,17 +185,50 @@ def get_ollama_env() -> dict:
     return env
 
 
+_OLLAMA_HOST = "127.0.0.1"
+_OLLAMA_PORT = 11434
+
+
+def _ollama_port_open(timeout: float = 0.2) -> bool:
+    """Cheap TCP connect to the Ollama port — no HTTP, no httpx import."""
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            return sock.connect_ex((_OLLAMA_HOST, _OLLAMA_PORT)) == 0
+    except OSError:
+        return False
+
+
+# Set once /api/tags has answered in this process. While the port stays open
+# later checks trust it instead of repeating the HTTP round trip; a closed
+# port (server died or was quit) clears it so the next check re-confirms.
+_server_confirmed = False
+
+
 def is_ollama_running() -> bool:
     """
     Check if Ollama server is running.
 
+    A refused connect answers "no" straight away, so the common not-running
+    case (and every tick of start_ollama_server's readiness loop) skips
+    importing httpx and the HTTP round trip. An open port is confirmed with a
+    real /api/tags request the first time only; the summarizer's per-chunk
+    readiness checks then cost one local connect each.
+
     Returns:
         True if Ollama is responding, False otherwise
     """
+    global _server_confirmed
+    if not _ollama_port_open():
+        _server_confirmed = False
+        return False
+    if _server_confirmed:
+        return True
     try:
         import httpx
-        response = httpx.get('http://127.0.0.1:11434/api/tags', timeout=2)
-        return response.status_code == 200
+        response = httpx.get(f'http://{_OLLAMA_HOST}:{_OLLAMA_PORT}/api/tags', timeout=2)
+        _server_confirmed = response.status_code == 200
+        return _server_confirmed
     except Exception:
         return False
 
@@ -190,6 +257,9 @@ def _clear_pid() -> None:
         pass
 
 
+_READY_POLL_INTERVAL_S = 0.1
+
+
 def start_ollama_server(wait: bool = True, timeout: int = 30) -> bool:
     """
     Start the Ollama server if not already running.
@@ -235,13 +305,28 @@ def start_ollama_server(wait: bool = True, timeout: int = 30) -> bool:
         if not wait:
             return True
 
-        # Wait for server to be ready
+        # Wait for server to be ready. Block on the child rather than sleeping:
+        # proc.wait() paces the health poll exactly like the old sleep, but
+        # returns the moment `ollama serve` exits (port clash, missing dylib)
+        # instead of burning the rest of the timeout on a dead process. Until
+        # the server binds, each probe is one refused local connect, so the
+        # poll can run often enough to notice readiness within ~0.1s.
         start_time = time.time()
         while time.time() - start_time < timeout:
             if is_ollama_running():
                 logger.info("Ollama server is ready")
                 return True
-            time.sleep(0.5)
+            try:
+                proc.wait(timeout=_READY_POLL_INTERVAL_S)
+            except subprocess.TimeoutExpired:
+                continue
+            # Another instance may have won the port race we just lost.
+            if is_ollama_running():
+                logger.info("Ollama server is ready")
+                return True
+            logger.error(f"Ollama server exited with code {proc.returncode} before becoming ready")
+            _clear_pid()
+            return False
 
         logger.error(f"Ollama server did not start within {timeout} seconds")
         return False
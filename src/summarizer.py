@@ -6,6 +6,8 @@ except ImportError:
     OLLAMA_AVAILABLE = False
 import json
 import logging
+import os
+import random
 import re
 import subprocess
 import time
@@ -30,6 +32,18 @@ _LEADING_TIMESTAMP_RE = re.compile(r'(?m)^\[\d{1,3}:\d{2}(?::\d{2})?\]\s*')
 # title is parsed out of the response.
 _RE_THINK_BLOCK = re.compile(r'(?is)<(think|thought|thinking|reasoning)>.*?</\1>')
 
+# One-shot repair in summarize_transcript for the malformed JSON we actually
+# see: bare strings inside arrays. The item must start and end on
+# a non-space character, so the surrounding \s* runs and the item body can't
+# trade whitespace back and forth (the old lazy form was cubic in a long run of
+# whitespace). Plain greedy quantifiers only — possessive ones need 3.11.
+_ARRAY_ITEM_CHAR = r'[^"\[\]{},:\s]'
+_RE_UNQUOTED_ARRAY_ITEM = re.compile(
+    r'([\[,])\s*('
+    + _ARRAY_ITEM_CHAR + r'(?:[^"\[\]{},:]*' + _ARRAY_ITEM_CHAR + r')?'
+    + r')\s*([\],])'
+)
+
 
 def _strip_leading_timestamps(transcript: str) -> str:
     if not transcript:
@@ -103,14 +117,35 @@ _OLLAMA_MODEL_NUM_CTX = {
     "gpt-oss:20b": 32768,
 }
 
+# Map calls in flight at once. Ollama serves OLLAMA_NUM_PARALLEL requests per
+# loaded model concurrently (its KV cache is sized for that many slots at
+# load) and queues the rest, so match it: unset/1 keeps the map strictly
+# sequential; a user who raised it for their server gets the map fanned out.
+def _map_concurrency() -> int:
+    try:
+        return max(1, int(os.environ.get("OLLAMA_NUM_PARALLEL", "1")))
+    except ValueError:
+        return 1
+
+
 # Map-reduce summarization constants
+_MAP_PROMPT_HEAD = (
+    "Extract only what is explicitly stated in the meeting transcript segment "
+    "below. Be concise.\n\n"
+    "KEY POINTS\n- ...\n\n"
+    "DECISIONS\n- ...\n\n"
+    "ACTION ITEMS\n- [owner] action (deadline if mentioned)\n\n"
+    "OPEN QUESTIONS\n- ...\n\n"
+)
 MAP_PROMPT_OVERHEAD_TOKENS = 300  # reserve for map prompt scaffolding
 MAP_OUTPUT_MAX_TOKENS = 600       # hard cap on each map call's output
+SUMMARY_OUTPUT_MAX_TOKENS = 8192  # runaway guard on streamed summaries; matches the cloud max_tokens
 CHARS_PER_TOKEN = 4               # English baseline; used for the reduce-fits size check
                                   # (_map_reduce_streaming / _hierarchical_reduce). The
                                   # needs_chunking gate uses the conservative floor below.
 _CHUNK_SAFETY_CHARS_PER_TOKEN = 2 # used for chunk budget: worst-case German/BPE (2.0 c/t floor)
 _OVERLAP_RATIO = 0.05             # last 5% of previous chunk prepended to next
+_CONTEXT_TRUNCATION_MARKER = "\n\n[... middle of the meeting omitted to fit the model's context ...]\n\n"
 
 
 def resolve_num_ctx(model_name: str) -> int:
@@ -131,6 +166,14 @@ def resolve_num_ctx(model_name: str) -> int:
 
 
 class OllamaSummarizer:
+    # _ensure_ollama_ready() runs before every map/reduce call and retry, and
+    # each run used to re-list every installed model over HTTP. Remember the
+    # model we last confirmed and skip the listing for MODEL_CHECK_TTL_S; a
+    # model switch (fallback, set_model) misses the memo and re-checks.
+    MODEL_CHECK_TTL_S = 30.0
+    _confirmed_model: Optional[str] = None
+    _confirmed_at: float = 0.0
+
     def __init__(self, model_name: Optional[str] = None, ai_provider: Optional[str] = None, config: Optional['Config'] = None):
         """
         Initialize the summarizer with automatic service management.
@@ -247,8 +290,9 @@ class OllamaSummarizer:
                     model_name = config.DEFAULT_MODEL
 
             self.model_name = resolve_runtime_tag(model_name)
-            self._ensure_ollama_ready()
+            # Built first so the model check below shares its connection pool.
             self.client = ollama.Client()
+            self._ensure_ollama_ready()
     
     def _is_ollama_running(self) -> bool:
         """Check if Ollama service is running."""
@@ -323,15 +367,16 @@ class OllamaSummarizer:
         return result
 
     def _create_map_prompt(self, chunk: str, chunk_num: int, total_chunks: int) -> str:
-        """Compact extraction prompt for one transcript chunk (map step)."""
+        """Compact extraction prompt for one transcript chunk (map step).
+
+        The instructions come first and are identical for every chunk, so
+        Ollama reuses their KV cache across map calls instead of re-running
+        prefill; the per-chunk position sits after them.
+        """
         return (
-            f"This is part {chunk_num} of {total_chunks} of a meeting transcript.\n"
-            "Extract only what is explicitly stated. Be concise.\n\n"
-            "KEY POINTS\n- ...\n\n"
-            "DECISIONS\n- ...\n\n"
-            "ACTION ITEMS\n- [owner] action (deadline if mentioned)\n\n"
-            "OPEN QUESTIONS\n- ...\n\n"
-            f"TRANSCRIPT SEGMENT:\n{chunk}"
+            _MAP_PROMPT_HEAD
+            + f"This is part {chunk_num} of {total_chunks} of a meeting transcript.\n"
+            + f"TRANSCRIPT SEGMENT:\n{chunk}"
         )
 
     def _chat_no_think(self, client, **kwargs):
@@ -419,6 +464,44 @@ class OllamaSummarizer:
             )
         return result
 
+    def _map_chunks(self, chunks: list[str], progress_callback=None) -> list[str]:
+        """Run the map call for every chunk, results in chunk order.
+
+        progress_callback(k, n) reports chunk k as the one being worked on.
+        With _map_concurrency() > 1 the calls overlap on a thread pool and the
+        counter advances as they finish; the first failure propagates and
+        cancels any chunk not yet started.
+        """
+        n = len(chunks)
+        workers = min(_map_concurrency(), n)
+        if workers <= 1:
+            results = []
+            for i, chunk in enumerate(chunks):
+                if progress_callback:
+                    progress_callback(i + 1, n)
+                results.append(self._summarize_chunk(chunk, i + 1, n))
+            return results
+
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        results: list[Optional[str]] = [None] * n
+        if progress_callback:
+            progress_callback(1, n)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(self._summarize_chunk, chunk, i + 1, n): i
+                for i, chunk in enumerate(chunks)
+            }
+            try:
+                for done, future in enumerate(as_completed(futures), start=1):
+                    results[futures[future]] = future.result()
+                    if progress_callback and done < n:
+                        progress_callback(done + 1, n)
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+        return results
+
     def _create_reduce_prompt(self, map_results: list[str], language: str = "en", notes: str = None) -> str:
         """Reduce prompt: merge N map-extracted summaries into a single coherent note."""
         n = len(map_results)
@@ -487,6 +570,42 @@ class OllamaSummarizer:
         estimated_tokens = (len(transcript) + len(notes or "")) / _CHUNK_SAFETY_CHARS_PER_TOKEN
         return estimated_tokens > num_ctx * 0.8
 
+    def _fit_to_context(self, transcript: str, notes: str = None) -> str:
+        """Trim an over-long transcript for a path that makes a single call.
+
+        The template-report and structured-JSON prompts put their instructions
+        ahead of the transcript and have no map-reduce fallback, so a meeting
+        past the _needs_chunking gate would overflow num_ctx and lose the
+        instructions to Ollama's own truncation. Keep the opening 30% and the
+        closing 60% of the budget (agenda; decisions and action items) on line
+        boundaries and drop the middle instead.
+
+        Sized on the CHARS_PER_TOKEN estimate, not the _needs_chunking floor:
+        that floor is a worst case for picking map-reduce, and trimming on it
+        would cut transcripts (about an hour of English at 32k) that fit today.
+        Notes come out of the same budget, but the transcript always keeps at
+        least half of it.
+        """
+        if self.ai_provider not in ("local", "remote"):
+            return transcript
+        num_ctx = resolve_num_ctx(self.model_name)
+        context_chars = int(num_ctx * 0.8 * CHARS_PER_TOKEN)
+        budget = context_chars - min(len(notes or ""), context_chars // 2)
+        if len(transcript) <= budget:
+            return transcript
+        head_len = max(budget * 3 // 10, 0)
+        tail_len = max(budget * 6 // 10, 1)
+        head_end = transcript.rfind("\n", 0, head_len)
+        if head_end <= 0:
+            head_end = head_len
+        tail_start = transcript.find("\n", len(transcript) - tail_len)
+        tail_start = len(transcript) - tail_len if tail_start == -1 else tail_start + 1
+        logger.warning(
+            f"Transcript exceeds the {num_ctx}-token context; omitting "
+            f"{tail_start - head_end} middle characters for a single-call prompt"
+        )
+        return transcript[:head_end] + _CONTEXT_TRUNCATION_MARKER + transcript[tail_start:]
+
     def _hierarchical_reduce(self, map_results: list[str], depth: int, progress_callback=None) -> list[str]:
         """Re-chunk map results that are too large for a single reduce call (max depth 2)."""
         if depth > 2:
@@ -501,11 +620,7 @@ class OllamaSummarizer:
         # batch of map-style calls, so without ticks the UI sits on "reducing"
         # for the whole pass and can look hung on a slow CPU-only host (the calls
         # can be minutes each). A moving counter shows the work is progressing.
-        new_results = []
-        for i, chunk in enumerate(chunks):
-            if progress_callback:
-                progress_callback(i + 1, n)
-            new_results.append(self._summarize_chunk(chunk, i + 1, n))
+        new_results = self._map_chunks(chunks, progress_callback)
         num_ctx = resolve_num_ctx(self.model_name)
         combined_tokens = len("\n\n".join(new_results)) / CHARS_PER_TOKEN
         if combined_tokens > num_ctx * 0.7:
@@ -522,12 +637,7 @@ class OllamaSummarizer:
         """Map-reduce generator: chunks → parallel map → streaming reduce."""
         chunks = self._split_into_chunks(transcript)
         n = len(chunks)
-        map_results = []
-
-        for i, chunk in enumerate(chunks):
-            if progress_callback:
-                progress_callback(i + 1, n)
-            map_results.append(self._summarize_chunk(chunk, i + 1, n))
+        map_results = self._map_chunks(chunks, progress_callback)
 
         # Signal: now entering the reduce step (step > total is unambiguous)
         if progress_callback:
@@ -555,7 +665,7 @@ class OllamaSummarizer:
             self.client,
             model=self.model_name,
             messages=[{"role": "user", "content": reduce_prompt}],
-            options=self._ollama_options(),
+            options={**self._ollama_options(), "num_predict": SUMMARY_OUTPUT_MAX_TOKENS},
         )
         streamed_chunks = []
         for chunk in response:
@@ -569,131 +679,25 @@ class OllamaSummarizer:
         if not ''.join(streamed_chunks).strip():
             raise ValueError("Reduce step returned empty result")
 
-    def _repair_json(self, json_text: str) -> Optional[str]:
-        """
-        Attempt to repair common JSON formatting issues.
-        
-        Args:
-            json_text: The malformed JSON string
-            
-        Returns:
-            Repaired JSON string or None if repair fails
-        """
-        try:
-            logger.info("Attempting JSON repair...")
-            repaired = json_text
-            
-            # Common repair patterns
-            repairs = [
-                # Fix unquoted strings in arrays (the original issue)
-                (r'(\[|\,)\s*([^"\[\]{},:]+?)\s*(\]|\,)', r'\1 "\2" \3'),
-                # Fix trailing commas
-                (r',\s*}', '}'),
-                (r',\s*]', ']'),
-                # Fix missing quotes around object keys
-                (r'(\{|\,)\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*:', r'\1 "\2":'),
-                # Fix single quotes to double quotes
-                (r"'([^']*)'", r'"\1"'),
-            ]
-            
-            for pattern, replacement in repairs:
-                import re
-                old_repaired = repaired
-                repaired = re.sub(pattern, replacement, repaired)
-                if old_repaired != repaired:
-                    logger.info(f"Applied repair: {pattern}")
-            
-            # Test if repaired JSON is valid
-            json.loads(repaired)
-            logger.info("JSON repair successful")
-            return repaired
-            
-        except Exception as e:
-            logger.error(f"JSON repair failed: {e}")
-            return None
-    
-    def _create_enhanced_fallback(self, malformed_response: str, transcript: str, duration_minutes: int) -> MeetingTranscript:
-        """
-        Create an enhanced fallback summary by extracting whatever data we can.
-        
-        Args:
-            malformed_response: The malformed JSON response from Ollama
-            transcript: Original transcript
-            duration_minutes: Meeting duration
-            
-        Returns:
-            MeetingTranscript with extracted data
-        """
-        logger.info("Creating enhanced fallback summary...")
-        
-        # Try to extract useful information from malformed response
-        overview = "Meeting transcript was processed but JSON parsing failed."
-        participants = []
-        key_points = []
-        
-        try:
-            # Extract overview if present
-            if '"overview"' in malformed_response:
-                import re
-                overview_match = re.search(r'"overview":\s*"([^"]*)"', malformed_response)
-                if overview_match:
-                    overview = overview_match.group(1)
-                    logger.info("Extracted overview from malformed response")
-            
-            # Extract participants if present
-            if '"participants"' in malformed_response:
-                # Try to find participant names between quotes
-                import re
-                participants_section = re.search(r'"participants":\s*\[(.*?)\]', malformed_response, re.DOTALL)
-                if participants_section:
-                    # Extract quoted strings
-                    quoted_names = re.findall(r'"([^"]+)"', participants_section.group(1))
-                    participants = quoted_names
-                    logger.info(f"Extracted {len(participants)} participants from malformed response")
-            
-            # Extract key points if present
-            if '"key_points"' in malformed_response:
-                import re
-                key_points_section = re.search(r'"key_points":\s*\[(.*?)\]', malformed_response, re.DOTALL)
-                if key_points_section:
-                    # Extract quoted strings
-                    quoted_points = re.findall(r'"([^"]+)"', key_points_section.group(1))
-                    key_points = quoted_points
-                    logger.info(f"Extracted {len(key_points)} key points from malformed response")
-            
-        except Exception as e:
-            logger.warning(f"Failed to extract data from malformed response: {e}")
-        
-        # Create fallback summary with extracted data
-        fallback_summary = MeetingTranscript(
-            duration=f"{duration_minutes} minutes",
-            overview=overview,
-            participants=participants,
-            next_steps=[],  # Create empty action items since parsing failed
-            key_points=[],  # Create empty key points since parsing failed  
-            transcript=transcript
-        )
-        
-        # Add key points
-        for point in key_points:
-            from .models import Decision
-            fallback_summary.key_points.append(Decision(
-                decision=point,
-                assignee='',
-                context='Extracted from partially parsed response'
-            ))
-        
-        logger.info("Created enhanced fallback summary with extracted data")
-        return fallback_summary
-    
     def _ensure_model_available(self) -> bool:
         """Ensure the required model is downloaded and available (uses HTTP API)."""
+        if (self._confirmed_model == self.model_name
+                and time.monotonic() - self._confirmed_at < self.MODEL_CHECK_TTL_S):
+            return True
+        if self._check_model_available():
+            self._confirmed_model = self.model_name
+            self._confirmed_at = time.monotonic()
+            return True
+        return False
+
+    def _check_model_available(self) -> bool:
+        """Uncached body of _ensure_model_available: list, pull, or fall back."""
         try:
             # Use the ollama Python client (HTTP API) instead of the binary
             # This avoids SIP/DYLD issues on macOS when running from a packaged app
-            response = ollama.list()
+            response = self.client.list()
             models = getattr(response, 'models', []) or []
-            model_names = [getattr(m, 'model', '') for m in models]
+            model_names = {getattr(m, 'model', '') for m in models}
 
             if self.model_name in model_names:
                 logger.info(f"Model {self.model_name} is already available")
@@ -702,7 +706,7 @@ class OllamaSummarizer:
             # Model not found, try to pull it
             logger.info(f"Downloading model {self.model_name}...")
             try:
-                ollama.pull(self.model_name)
+                self.client.pull(self.model_name)
                 logger.info(f"Successfully downloaded model {self.model_name}")
                 return True
             except Exception as e:
@@ -729,12 +733,18 @@ class OllamaSummarizer:
             for fallback in fallback_models:
                 logger.info(f"Trying fallback model: {fallback}")
                 try:
-                    ollama.pull(fallback)
+                    self.client.pull(fallback)
                     logger.info(f"Successfully downloaded fallback model {fallback}")
                     self.model_name = fallback
                     return True
-                except Exception:
+                except ollama.ResponseError:
+                    # The server answered but couldn't pull this tag; try the next.
                     continue
+                except Exception as e:
+                    # The server itself is unreachable, so every remaining pull
+                    # would fail the same way.
+                    logger.error(f"Giving up on fallback models: {e}")
+                    break
 
             return False
 
@@ -1181,7 +1191,8 @@ Return ONLY the response in this exact JSON format:
                     duration_minutes=duration_minutes
                 )
             
-            prompt = self._create_permissive_prompt(transcript, language, notes=notes)
+            prompt = self._create_permissive_prompt(
+                self._fit_to_context(transcript, notes), language, notes=notes)
             logger.info(f"Sending transcript to {self.ai_provider} model: {self.model_name}")
             logger.info(f"Transcript length: {len(transcript)} characters")
 
@@ -1204,11 +1215,12 @@ Return ONLY the response in this exact JSON format:
                     try:
                         if attempt > 0:
                             logger.info(f"Retry attempt {attempt + 1}/{max_retries}")
-                            if self.ai_provider == "remote":
-                                self.client = ollama.Client(host=self.remote_url)
-                            else:
+                            # Keep self.client: its httpx pool drops a dead
+                            # connection and redials on the next request. Only
+                            # a server that has actually gone away needs the
+                            # full restart + model check.
+                            if self.ai_provider != "remote" and not self._is_ollama_running():
                                 self._ensure_ollama_ready()
-                                self.client = ollama.Client()
 
                         # think=False: this JSON-summary path wants direct
                         # structured output, not reasoning. See _summarize_chunk.
@@ -1231,8 +1243,11 @@ Return ONLY the response in this exact JSON format:
                         if attempt == max_retries - 1:
                             raise
                         else:
-                            logger.info("Waiting 5 seconds before retry...")
-                            time.sleep(5)
+                            # Full jitter, so concurrent requests that failed
+                            # together (e.g. across a server restart) spread out.
+                            delay = random.uniform(0.5, 2 ** attempt)
+                            logger.info(f"Waiting {delay:.1f} seconds before retry...")
+                            time.sleep(delay)
 
                 response_text = ollama_response['message']['content'].strip()
 
@@ -1268,8 +1283,7 @@ Return ONLY the response in this exact JSON format:
                 logger.info("Attempting simple JSON repair for unquoted strings...")
                 
                 # Simple fix for unquoted strings in arrays (the actual issue we encountered)
-                import re
-                repaired_json = re.sub(r'(\[|\,)\s*([^"\[\]{},:]+?)\s*(\]|\,)', r'\1 "\2" \3', response_text)
+                repaired_json = _RE_UNQUOTED_ARRAY_ITEM.sub(r'\1 "\2" \3', response_text)
                 
                 try:
                     structured_data = json.loads(repaired_json)
@@ -1463,7 +1477,7 @@ TRANSCRIPT:
             self.client,
             model=self.model_name,
             messages=[{'role': 'user', 'content': prompt}],
-            options=self._ollama_options(),
+            options={**self._ollama_options(), "num_predict": SUMMARY_OUTPUT_MAX_TOKENS},
         )
         for chunk in response:
             content = chunk.get('message', {}).get('content', '')
@@ -1563,7 +1577,8 @@ TRANSCRIPT:
             # summary-schema specific and don't apply here). Stream through the
             # ACTIVE provider — not straight to Ollama, which has no client and
             # would crash in cloud/adapter mode.
-            prompt = self._create_template_report_prompt(transcript, template_prompt, language, notes)
+            prompt = self._create_template_report_prompt(
+                self._fit_to_context(transcript, notes), template_prompt, language, notes)
             inner = self._stream_completion(prompt)
             empty_message = "Model returned an empty report"
         elif self._needs_chunking(transcript, notes):
@@ -1667,10 +1682,6 @@ TRANSCRIPT:
                     pass
             self.ollama_process = None
     
-    def __del__(self):
-        """Cleanup when object is destroyed."""
-        self.cleanup()
-
     def generate_title(self, summary: str, transcript: str, language: str = "en") -> Optional[str]:
         """
         Generate a short, descriptive meeting title from the summary and transcript.
@@ -1814,7 +1825,7 @@ ANSWER:"""
 
     def query_transcript_streaming(self, transcript: str, question: str, language: str = "en"):
         """Generator that yields text chunks from the LLM for a transcript query."""
-        if not transcript or transcript.strip() == "":
+        if not transcript or transcript.isspace():
             yield "No transcript available to query."
             return
         if not question or question.strip() == "":
@@ -1862,11 +1873,8 @@ ANSWER:"""
                         if content:
                             yield content
             else:
-                if self.ai_provider == "remote":
-                    self.client = ollama.Client(host=self.remote_url)
-                else:
+                if self.ai_provider != "remote":
                     self._ensure_ollama_ready()
-                    self.client = ollama.Client()
                 stream = self.client.chat(
                     model=self.model_name,
                     messages=[{"role": "user", "content": prompt}],
@@ -1894,7 +1902,7 @@ ANSWER:"""
             Answer string or None if query failed
         """
         try:
-            if not transcript or transcript.strip() == "":
+            if not transcript or transcript.isspace():
                 return "No transcript available to query."
 
             if not question or question.strip() == "":
@@ -1915,11 +1923,12 @@ ANSWER:"""
                     try:
                         if attempt > 0:
                             logger.info(f"Retry attempt {attempt + 1}/{max_retries}")
-                            if self.ai_provider == "remote":
-                                self.client = ollama.Client(host=self.remote_url)
-                            else:
+                            # Keep self.client: its httpx pool drops a dead
+                            # connection and redials on the next request. Only
+                            # a server that has actually gone away needs the
+                            # full restart + model check.
+                            if self.ai_provider != "remote" and not self._is_ollama_running():
                                 self._ensure_ollama_ready()
-                                self.client = ollama.Client()
 
                         ollama_response = self.client.chat(
                             model=self.model_name,
@@ -1938,8 +1947,11 @@ ANSWER:"""
                         if attempt == max_retries - 1:
                             raise
                         else:
-                            logger.info("Waiting 2 seconds before retry...")
-                            time.sleep(2)
+                            # Full jitter, so concurrent requests that failed
+                            # together (e.g. across a server restart) spread out.
+                            delay = random.uniform(0.5, 2 ** attempt)
+                            logger.info(f"Waiting {delay:.1f} seconds before retry...")
+                            time.sleep(delay)
 
                 response_text = ollama_response['message']['content'].strip()
             logger.info(f"Query response received: {len(response_text)} characters")
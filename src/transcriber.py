@@ -27,6 +27,8 @@ ASR engine would now strictly remove real speech without preventing
 anything; the model is the source of truth.
 """
 
+import concurrent.futures
+import importlib.util
 import inspect
 import logging
 import math
@@ -113,6 +115,19 @@ RMS_MAX_WINDOWS = 60
 # can detect it exactly.
 SILENCE_SENTINEL = "No speech detected in audio"
 
+# Decode settings for the whisper.cpp path. Pinned rather than left to the
+# library defaults: greedy decoding already runs a single beam, but on a
+# temperature fallback whisper.cpp samples ``best_of`` (default 5) candidates
+# per window — five decoder passes on exactly the noisy stretches that trigger
+# fallbacks. ``no_context`` stops each 30 s window conditioning on the last
+# one's text, which shortens the decoder prompt and keeps a loop
+# hallucination from seeding the next window. Keys the installed
+# pywhispercpp doesn't know are dropped (see _whisper_cpp_decode_params).
+WHISPER_CPP_DECODE_PARAMS = {
+    "no_context": True,
+    "greedy": {"best_of": 1},
+}
+
 
 # Resolve a usable ffmpeg binary. Electron-spawned subprocesses don't inherit
 # the user's shell PATH (no /opt/homebrew/bin), so a bare `ffmpeg` string fails
@@ -141,10 +156,14 @@ def _resolve_ffmpeg() -> Optional[str]:
                 str(exe_dir / binary_name),
                 str(exe_dir / '_internal' / binary_name),
             ])
+            if hasattr(sys, '_MEIPASS'):
+                candidates.append(str(Path(sys._MEIPASS) / binary_name))
         # PATH (cross-platform; honours PATHEXT on Windows)
         on_path = shutil.which("ffmpeg")
         if on_path:
             candidates.append(on_path)
+        if not getattr(sys, 'frozen', False):
+            candidates.append(str(Path(__file__).parent.parent / 'bin' / binary_name))
         if sys.platform != "win32":
             candidates.extend([
                 '/opt/homebrew/bin/ffmpeg',
@@ -158,7 +177,8 @@ def _resolve_ffmpeg() -> Optional[str]:
                     _FFMPEG_PATH_CACHE = cand
                     logger.info(f"ffmpeg resolved at: {cand}")
                     return cand
-            except (FileNotFoundError, subprocess.TimeoutExpired):
+            except (OSError, subprocess.TimeoutExpired):
+                # Missing, not executable, or not a binary for this machine.
                 continue
         logger.warning("ffmpeg not found in any candidate location")
         return None
@@ -229,6 +249,32 @@ def _rms_of_pcm16(raw: bytes, n_samples: int) -> float:
     return math.sqrt(sum((s / 32768.0) ** 2 for s in unpacked) / len(unpacked))
 
 
+def _read_pcm16_mono_16k(wav_path: Path):
+    """Return a 16 kHz mono 16-bit WAV as float32 samples in [-1, 1).
+
+    pywhispercpp decodes a *path* by spawning its own ffmpeg and piping raw
+    PCM back, even when the file is already the exact format it wants — a
+    second full decode of the meeting on top of ``_convert_to_16khz``.
+    Handing it the samples directly skips that. Returns None when numpy is
+    missing or the file isn't that format, so the caller can pass the path.
+    """
+    import wave
+
+    if not _NUMPY_AVAILABLE:
+        return None
+    try:
+        with wave.open(str(wav_path), 'rb') as wf:
+            if (wf.getframerate() != 16000 or wf.getnchannels() != 1
+                    or wf.getsampwidth() != 2):
+                return None
+            raw = wf.readframes(wf.getnframes())
+    except Exception:
+        return None
+    samples = _np.frombuffer(raw, dtype='<i2').astype(_np.float32)
+    samples /= 32768.0
+    return samples
+
+
 def _scan_max_rms(wf, window: int, step: int, early_exit_threshold: float) -> float:
     """Return the maximum RMS amplitude found across stepped 1-second windows."""
     n_frames = wf.getnframes()
@@ -421,13 +467,34 @@ except ImportError:
 
 # whisper.cpp via pywhispercpp is the cross-platform fallback that keeps
 # Intel-Mac DMGs working (parakeet-mlx is Apple-Silicon-only). Bundled
-# unconditionally in stenoai.spec and lazily probed here at import time.
-try:
-    from pywhispercpp.model import Model as WhisperCppModel
-    WHISPER_CPP_AVAILABLE = True
-except ImportError:
-    WhisperCppModel = None
-    WHISPER_CPP_AVAILABLE = False
+# unconditionally in stenoai.spec. Probed with find_spec rather than imported:
+# pywhispercpp.model loads the native whisper.cpp library and drags in
+# requests/tqdm for its downloader, and every CLI command imports this module
+# (via simple_recorder) whether or not it transcribes with whisper.cpp. The
+# real import happens in _load_whisper_cpp.
+WHISPER_CPP_AVAILABLE = importlib.util.find_spec("pywhispercpp") is not None
+
+
+def _whisper_cpp_param_names() -> frozenset:
+    """Param keys the installed pywhispercpp accepts on transcribe().
+
+    pywhispercpp forwards transcribe(**params) straight onto the C params
+    struct, so an unknown key raises mid-transcription.
+    """
+    try:
+        from pywhispercpp.constants import PARAMS_SCHEMA
+    except ImportError:
+        return frozenset()
+    return frozenset(PARAMS_SCHEMA)
+
+
+def _whisper_cpp_decode_params() -> dict:
+    """WHISPER_CPP_DECODE_PARAMS minus keys this pywhispercpp doesn't accept."""
+    names = _whisper_cpp_param_names()
+    return {
+        key: value for key, value in WHISPER_CPP_DECODE_PARAMS.items()
+        if key in names
+    }
 
 if not PARAKEET_AVAILABLE and not WHISPER_CPP_AVAILABLE:
     logger.warning(
@@ -474,6 +541,7 @@ class WhisperTranscriber:
         #     fall back to whisper.cpp as before
         self.model_size = model_size
         self.model = None
+        self._model_future = None
 
         try:
             from src.config import get_config
@@ -483,12 +551,20 @@ class WhisperTranscriber:
 
         if requested == "whisper" and WHISPER_CPP_AVAILABLE:
             self.backend = "whisper.cpp"
-            self._load_whisper_cpp()
+            try:
+                self._load_whisper_cpp(background=True)
+            except ImportError as e:
+                # find_spec saw the package but its native library didn't
+                # load — same outcome as pywhispercpp being absent.
+                if not PARAKEET_AVAILABLE:
+                    raise
+                logger.warning("pywhispercpp failed to import; using Parakeet: %s", e)
+                self.backend = "parakeet-tdt-v3"
         elif PARAKEET_AVAILABLE:
             self.backend = "parakeet-tdt-v3"
         else:
             self.backend = "whisper.cpp"
-            self._load_whisper_cpp()
+            self._load_whisper_cpp(background=True)
         fallback = (self.backend == "whisper.cpp") != (requested == "whisper")
         logger.info(
             "ASR engine selected: requested=%s using=%s fallback=%s",
@@ -496,18 +572,47 @@ class WhisperTranscriber:
         )
         self._ensure_ffmpeg_in_path()
 
-    def _load_whisper_cpp(self) -> None:
+    def _load_whisper_cpp(self, background: bool = False) -> None:
         """Load the whisper.cpp model lazily for the Intel-Mac fallback path.
 
         pywhispercpp auto-downloads the ggml weight on first construction;
         ``self.model_size`` should be one of the entries in
         ``src/whisper_models.py`` (large-v3-turbo is the default).
+
+        With ``background=True`` (engine selection in ``__init__``) the
+        import still happens here, so a broken pywhispercpp raises
+        ImportError to the caller, but the multi-second ggml load runs on a
+        worker thread and overlaps the ffmpeg channel split / pre-processing
+        that precede the first decode. ``_await_model`` joins it.
         """
         import multiprocessing
+        from pywhispercpp.model import Model as WhisperCppModel
         n_threads = max(1, multiprocessing.cpu_count() - 2)
-        logger.info("Loading whisper.cpp model: %s", self.model_size)
-        self.model = WhisperCppModel(self.model_size, n_threads=n_threads)
-        logger.info("whisper.cpp model loaded (threads=%d)", n_threads)
+
+        def _load() -> None:
+            logger.info("Loading whisper.cpp model: %s", self.model_size)
+            self.model = WhisperCppModel(self.model_size, n_threads=n_threads)
+            logger.info("whisper.cpp model loaded (threads=%d)", n_threads)
+
+        if not background:
+            _load()
+            return
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="whisper-cpp-load",
+        )
+        self._model_future = executor.submit(_load)
+        executor.shutdown(wait=False)
+
+    def _await_model(self) -> None:
+        """Block until a background whisper.cpp load finishes.
+
+        Re-raises the load's exception (e.g. a failed weight download) so it
+        surfaces as a transcription failure rather than an empty result.
+        """
+        future = getattr(self, "_model_future", None)
+        if future is not None:
+            self._model_future = None
+            future.result()
 
     def _build_whisper_fallback(self) -> bool:
         """Try to stand up whisper.cpp as a crash-recovery fallback engine.
@@ -546,63 +651,21 @@ class WhisperTranscriber:
         We don't need ffmpeg for the basic transcribe path anymore (Parakeet
         handles arbitrary formats via librosa), but the stereo-channel split
         in ``transcribe_diarised`` still calls ffmpeg with a `pan` filter to
-        separate the mic and system channels.
+        separate the mic and system channels. Resolution goes through the
+        cached ``_resolve_ffmpeg`` so constructing another transcriber in the
+        same process doesn't re-probe every candidate with ``-version``.
         """
-        exe_suffix = ".exe" if sys.platform == "win32" else ""
-        binary_name = f"ffmpeg{exe_suffix}"
-        possible_ffmpeg_paths = []
-
-        if getattr(sys, 'frozen', False):
-            exe_dir = Path(sys.executable).parent
-            root_ffmpeg = exe_dir / binary_name
-            if root_ffmpeg.exists():
-                possible_ffmpeg_paths.append(str(root_ffmpeg))
-            if hasattr(sys, '_MEIPASS'):
-                meipass_ffmpeg = Path(sys._MEIPASS) / binary_name
-                if meipass_ffmpeg.exists():
-                    possible_ffmpeg_paths.append(str(meipass_ffmpeg))
-            internal_ffmpeg = exe_dir / '_internal' / binary_name
-            if internal_ffmpeg.exists():
-                possible_ffmpeg_paths.append(str(internal_ffmpeg))
-        else:
-            dev_ffmpeg = Path(__file__).parent.parent / 'bin' / binary_name
-            if dev_ffmpeg.exists():
-                possible_ffmpeg_paths.append(str(dev_ffmpeg))
-
-        if sys.platform != "win32":
-            possible_ffmpeg_paths.extend([
-                '/opt/homebrew/bin/ffmpeg',
-                '/usr/local/bin/ffmpeg',
-                '/usr/bin/ffmpeg',
-            ])
-
-        try:
-            subprocess.run(['ffmpeg', '-version'], capture_output=True, timeout=5, check=True)
-            logger.info("ffmpeg found in PATH")
-            return
-        except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
-            pass
-
-        ffmpeg_found_path = None
-        for ffmpeg_path in possible_ffmpeg_paths:
-            try:
-                subprocess.run([ffmpeg_path, '-version'], capture_output=True, timeout=5, check=True)
-                ffmpeg_found_path = ffmpeg_path
-                logger.info(f"Found ffmpeg at: {ffmpeg_path}")
-                break
-            except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
-                continue
-
-        if ffmpeg_found_path:
-            ffmpeg_dir = os.path.dirname(ffmpeg_found_path)
-            current_path = os.environ.get('PATH', '')
-            if ffmpeg_dir not in current_path:
-                # os.pathsep is ':' on POSIX and ';' on Windows — hardcoding ':'
-                # corrupts PATH on Windows so the prepended dir never resolves.
-                os.environ['PATH'] = f"{ffmpeg_dir}{os.pathsep}{current_path}"
-                logger.info(f"Added {ffmpeg_dir} to PATH")
-        else:
+        ffmpeg = _resolve_ffmpeg()
+        if not ffmpeg:
             logger.warning("ffmpeg not found - stereo diarisation will fall back to mono")
+            return
+        ffmpeg_dir = os.path.dirname(ffmpeg)
+        current_path = os.environ.get('PATH', '')
+        if ffmpeg_dir not in current_path.split(os.pathsep):
+            # os.pathsep is ':' on POSIX and ';' on Windows — hardcoding ':'
+            # corrupts PATH on Windows so the prepended dir never resolves.
+            os.environ['PATH'] = f"{ffmpeg_dir}{os.pathsep}{current_path}"
+            logger.info(f"Added {ffmpeg_dir} to PATH")
 
     def _preprocess_audio(self, audio_filepath: Path) -> Tuple[Path, bool]:
         """Clean mono audio before transcription: high-pass + loudnorm.
@@ -773,6 +836,7 @@ class WhisperTranscriber:
         whisper.cpp is known to emit canned phrases like ``"Thank you."``
         repeatedly on silent input.
         """
+        self._await_model()
         if self.model is None:
             logger.error("whisper.cpp model not loaded")
             return {"text": None, "segments": [], "duration_seconds": None,
@@ -782,13 +846,15 @@ class WhisperTranscriber:
         cleanup_converted = converted_path != audio_filepath
 
         try:
+            samples = _read_pcm16_mono_16k(converted_path)
+            media = str(converted_path) if samples is None else samples
             resolved_language = language
             detected_language = None
             detected_language_probability = None
 
             if language == "auto":
                 try:
-                    detection_result, _ = self.model.auto_detect_language(media=str(converted_path))
+                    detection_result, _ = self.model.auto_detect_language(media=media)
                     if detection_result and len(detection_result) >= 1:
                         detected_language = detection_result[0]
                         resolved_language = detected_language
@@ -798,7 +864,7 @@ class WhisperTranscriber:
                     logger.warning("Failed to auto-detect language; using whisper default: %s", e)
                     resolved_language = None
 
-            transcribe_kwargs = {"media": str(converted_path)}
+            transcribe_kwargs = {"media": media, **_whisper_cpp_decode_params()}
             if resolved_language and resolved_language != "auto":
                 transcribe_kwargs["language"] = resolved_language
             # Per-segment heartbeat: keeps the Electron inactivity watchdog
@@ -820,38 +886,42 @@ class WhisperTranscriber:
             except (TypeError, ValueError):
                 pass
             segments = self.model.transcribe(**transcribe_kwargs)
+            # Strip each segment's text once; the dedup below, the per-segment
+            # dicts and the joined transcript all read these.
+            stripped = [(s.text.strip(), s) for s in segments or ()]
 
             # Dedup whisper.cpp loop hallucinations: 5+ consecutive identical
             # segments. Preserved from the historical whisper code path.
-            if segments:
+            if stripped:
                 deduped: list = []
                 i = 0
-                while i < len(segments):
-                    text = segments[i].text.strip()
+                while i < len(stripped):
+                    text = stripped[i][0]
                     run_end = i + 1
-                    while run_end < len(segments) and segments[run_end].text.strip() == text:
+                    while run_end < len(stripped) and stripped[run_end][0] == text:
                         run_end += 1
                     if run_end - i >= 5 and text:
                         # Log the count, not the text: dropped segments are
                         # transcript content and must not reach the debug log.
                         logger.warning("Dropped %d repeated whisper segments (%d chars each)", run_end - i, len(text))
                     else:
-                        deduped.extend(segments[i:run_end])
+                        deduped.extend(stripped[i:run_end])
                     i = run_end
-                segments = deduped
+                stripped = deduped
 
-            if not segments:
+            if not stripped:
                 return {"text": None, "segments": [], "duration_seconds": duration_seconds,
                         "detected_language": detected_language,
                         "detected_language_probability": detected_language_probability}
 
-            transcript = " ".join(s.text.strip() for s in segments)
+            out_segments = [
+                {"text": text, "start": s.t0 / 100.0, "end": s.t1 / 100.0}
+                for text, s in stripped if text
+            ]
+            transcript = " ".join(seg["text"] for seg in out_segments)
             return {
-                "text": transcript.strip() or None,
-                "segments": [
-                    {"text": s.text.strip(), "start": s.t0 / 100.0, "end": s.t1 / 100.0}
-                    for s in segments if s.text.strip()
-                ],
+                "text": transcript or None,
+                "segments": out_segments,
                 "duration_seconds": duration_seconds,
                 "detected_language": detected_language,
                 "detected_language_probability": detected_language_probability,
@@ -75,6 +75,7 @@ hiddenimports = [
     'pydantic',
     'pydantic.fields',
     'pydantic_core',
+    'orjson',
 
     # CLI
     'click',
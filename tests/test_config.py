@@ -4,6 +4,7 @@ import unittest
 from pathlib import Path
 from unittest.mock import patch
 
+from src import config as config_module
 from src.config import Config
 
 
@@ -185,6 +186,15 @@ class ConfigWhisperModelTests(unittest.TestCase):
             reloaded = Config(config_path=path)
             self.assertEqual(reloaded.get_whisper_model(), "large-v3-turbo")
 
+    def test_set_whisper_model_accepts_quantised_variant(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "config.json"
+            config = Config(config_path=path)
+            self.assertTrue(config.set_whisper_model("large-v3-turbo-q8_0"))
+            # Not treated as a retired tier by the load-time migration.
+            reloaded = Config(config_path=path)
+            self.assertEqual(reloaded.get_whisper_model(), "large-v3-turbo-q8_0")
+
     def test_set_whisper_model_rejects_unknown_size(self):
         with tempfile.TemporaryDirectory() as tmp_dir:
             config = Config(config_path=Path(tmp_dir) / "config.json")
@@ -226,6 +236,15 @@ class ConfigSummaryModelTests(unittest.TestCase):
             Config.SUPPORTED_MODELS["llama3.2:3b"].get("deprecated"), True
         )
 
+    def test_supported_models_registry_is_read_only(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = Config(config_path=Path(tmp_dir) / "config.json")
+            listed = config.list_supported_models()
+            self.assertIs(listed, Config.SUPPORTED_MODELS)
+            with self.assertRaises(TypeError):
+                listed["rogue:1b"] = {}
+            self.assertNotIn("rogue:1b", Config.SUPPORTED_MODELS)
+
     def test_existing_user_choice_survives_default_swap(self):
         # Migration safety: a user on a still-supported (even deprecated) model
         # keeps it; only a fresh config (no stored "model") gets the default.
@@ -314,6 +333,44 @@ class ConfigWhisperModelMigrationTests(unittest.TestCase):
             )
 
 
+class ConfigMigrationSaveCoalescingTests(unittest.TestCase):
+    """Load-time migrations each call _save(); __init__ defers them and writes
+    config.json once, so a load that trips several migrations costs one locked
+    write instead of one per migration."""
+
+    def test_several_migrations_write_once(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "config.json"
+            path.write_text(json.dumps({
+                "whisper_model": "medium",
+                "model": "gemma3:4b",
+                "language": "zh",
+                # Present so the privacy marker's own locked CAS stays out of it.
+                "privacy_notice_seen": True,
+            }))
+            with patch("src.config._atomic_write_json",
+                       wraps=config_module._atomic_write_json) as write:
+                config = Config(config_path=path)
+            self.assertEqual(write.call_count, 1)
+
+            on_disk = json.loads(path.read_text())
+            self.assertEqual(on_disk["whisper_model"], "large-v3-turbo")
+            self.assertEqual(on_disk["model"], Config.DEFAULT_MODEL)
+            self.assertEqual(on_disk["language"], "zh-Hans")
+            self.assertTrue(on_disk["templates_seeded"])
+            # Setters after load persist immediately again.
+            self.assertTrue(config.set_language("en"))
+            self.assertEqual(json.loads(path.read_text())["language"], "en")
+
+    def test_nothing_to_migrate_does_not_write(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "config.json"
+            Config(config_path=path)
+            with patch("src.config._atomic_write_json") as write:
+                Config(config_path=path)
+            write.assert_not_called()
+
+
 class ConfigAutoDetectMeetingsTests(unittest.TestCase):
     def test_default_auto_detect_meetings_is_true(self):
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -744,5 +801,66 @@ class MlxTagResolutionTests(unittest.TestCase):
         self.assertEqual(len(Config._MLX_TO_GGUF), len(Config._MLX_EQUIVALENTS))
 
 
+class DefaultBaseDirTests(unittest.TestCase):
+    def test_e2e_override_wins_even_from_source(self):
+        import os
+        from src.config import get_default_base_dir
+        with tempfile.TemporaryDirectory() as tmp, \
+                patch.dict(os.environ, {"STENOAI_USER_DATA_DIR": tmp}), \
+                patch("src.config.is_bundled", return_value=False):
+            self.assertEqual(get_default_base_dir(), Path(tmp))
+
+    def test_source_checkout_uses_repo_root(self):
+        import os
+        from src import config as config_mod
+        env = {k: v for k, v in os.environ.items() if k != "STENOAI_USER_DATA_DIR"}
+        with patch.dict(os.environ, env, clear=True), \
+                patch("src.config.is_bundled", return_value=False):
+            self.assertEqual(config_mod.get_default_base_dir(),
+                             Path(config_mod.__file__).parent.parent)
+
+    def test_get_data_dirs_and_config_share_the_default_base(self):
+        import os
+        from src.config import get_data_dirs
+        with tempfile.TemporaryDirectory() as tmp, \
+                patch.dict(os.environ, {"STENOAI_USER_DATA_DIR": tmp}):
+            cfg = Config()
+            self.assertEqual(cfg.config_path, Path(tmp) / "config.json")
+            with patch("src.config.get_config", return_value=cfg):
+                self.assertEqual(get_data_dirs()["output"], Path(tmp) / "output")
+
+
+
+class GetConfigSingletonTests(unittest.TestCase):
+    def test_concurrent_first_calls_build_one_instance(self):
+        import threading
+        import time
+
+        built = []
+        real_init = Config.__init__
+
+        def slow_init(self, *args, **kwargs):
+            built.append(self)
+            time.sleep(0.05)  # widen the check-then-assign window
+            real_init(self, *args, **kwargs)
+
+        results = []
+        with tempfile.TemporaryDirectory() as tmp, \
+                patch.dict("os.environ", {"STENOAI_USER_DATA_DIR": tmp}), \
+                patch.object(config_module, "_config_instance", None), \
+                patch.object(Config, "__init__", slow_init):
+            threads = [
+                threading.Thread(target=lambda: results.append(config_module.get_config()))
+                for _ in range(8)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        self.assertEqual(len(built), 1)
+        self.assertEqual(len(results), 8)
+        self.assertTrue(all(r is results[0] for r in results))
+
 if __name__ == "__main__":
     unittest.main()
@@ -50,7 +50,7 @@ class AtomicSaveTests(unittest.TestCase):
             self.assertTrue(config.set_ai_provider("cloud"))
             before = path.read_text()
 
-            with patch("src.config.json.dump", side_effect=OSError("disk full")):
+            with patch("src.config.os.fsync", side_effect=OSError("disk full")):
                 success = config.set_ai_provider("remote")
 
             self.assertFalse(success)
@@ -136,6 +136,15 @@ class FoldersSaveTests(unittest.TestCase):
             leftovers = [p for p in Path(tmp_dir).iterdir() if p.suffix == ".tmp"]
             self.assertEqual(leftovers, [])
 
+    def test_non_ascii_names_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            mgr = FoldersManager(Path(tmp_dir))
+            self.assertIsNotNone(mgr.create_folder("Büro 会议"))
+            reloaded = FoldersManager(Path(tmp_dir))
+            self.assertEqual(
+                [f["name"] for f in reloaded.list_folders()], ["Büro 会议"]
+            )
+
     def test_concurrent_editors_both_survive(self):
         """Each CLI operation is its own subprocess, so two managers can hold
         the same baseline. Re-reading under the lock is what keeps the second
@@ -151,6 +160,16 @@ class FoldersSaveTests(unittest.TestCase):
             names = [f["name"] for f in json.loads(path.read_text())["folders"]]
             self.assertEqual(sorted(names), ["Alpha", "Beta"])
 
+    def test_update_icon_targets_only_the_matching_folder(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = _seed(tmp_dir)
+            mgr = FoldersManager(Path(tmp_dir))
+
+            self.assertTrue(mgr.update_icon("bbb", "star"))
+            self.assertFalse(mgr.update_icon("nope", "star"))
+            icons = {f["id"]: f["icon"] for f in json.loads(path.read_text())["folders"]}
+            self.assertEqual(icons, {"aaa": "folder", "bbb": "star"})
+
     def test_rename_of_unknown_id_reports_failure_without_writing(self):
         with tempfile.TemporaryDirectory() as tmp_dir:
             path = _seed(tmp_dir)
@@ -165,5 +184,48 @@ class FoldersSaveTests(unittest.TestCase):
             self.assertEqual(on_disk["folders"][0]["name"], "Neuer Name")
 
 
+
+class MeetingFolderMembershipTests(unittest.TestCase):
+    def _summary(self, tmp_dir: str, folders) -> Path:
+        path = Path(tmp_dir) / "standup_summary.json"
+        path.write_text(json.dumps({"summary": "s", "folders": folders}), encoding="utf-8")
+        return path
+
+    def test_add_and_remove_round_trip_json_summary(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = self._summary(tmp_dir, [])
+            mgr = FoldersManager(Path(tmp_dir))
+
+            self.assertTrue(mgr.add_meeting_to_folder(path, "aaa"))
+            self.assertEqual(json.loads(path.read_text())["folders"], ["aaa"])
+            self.assertTrue(mgr.remove_meeting_from_folder(path, "aaa"))
+            self.assertEqual(json.loads(path.read_text())["folders"], [])
+
+    def test_md_membership_no_op_does_not_rewrite_the_note(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "standup.md"
+            path.write_text('---\ntitle: Standup\nfolders: ["aaa"]\n---\n# Notes\n',
+                            encoding="utf-8")
+            mgr = FoldersManager(Path(tmp_dir))
+
+            with patch("src.folders._atomic_write_text") as write:
+                self.assertTrue(mgr.add_meeting_to_folder(path, "aaa"))
+                self.assertTrue(mgr.remove_meeting_from_folder(path, "zzz"))
+            write.assert_not_called()
+
+            self.assertTrue(mgr.add_meeting_to_folder(path, "bbb"))
+            self.assertIn('folders: ["aaa", "bbb"]', path.read_text(encoding="utf-8"))
+
+    def test_failed_write_preserves_summary(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = self._summary(tmp_dir, ["bbb"])
+            mgr = FoldersManager(Path(tmp_dir))
+            before = path.read_text(encoding="utf-8")
+
+            with patch("src.config.os.fsync", side_effect=OSError("disk full")):
+                self.assertFalse(mgr.add_meeting_to_folder(path, "aaa"))
+
+            self.assertEqual(path.read_text(encoding="utf-8"), before)
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,32 @@
+"""src._json must parse identically with and without the orjson wheel."""
+import json
+import unittest
+from unittest import mock
+
+from src import _json
+
+_DOC = '{"session_info": {"name": "Caf\\u00e9 sync ☕"}, "key_points": ["a", "b"], "n": 3}'
+
+
+class JsonFastPathTests(unittest.TestCase):
+    def test_str_and_bytes_parse_the_same_with_orjson(self):
+        if _json.orjson is None:
+            self.skipTest("orjson not installed")
+        expected = json.loads(_DOC)
+        self.assertEqual(_json.loads(_DOC), expected)
+        self.assertEqual(_json.loads(_DOC.encode("utf-8")), expected)
+
+    def test_stdlib_fallback_when_orjson_missing(self):
+        with mock.patch.object(_json, "orjson", None):
+            self.assertEqual(_json.loads(_DOC.encode("utf-8")), json.loads(_DOC))
+
+    def test_malformed_input_raises_value_error_on_both_paths(self):
+        with self.assertRaises(ValueError):
+            _json.loads(b"{not json")
+        with mock.patch.object(_json, "orjson", None):
+            with self.assertRaises(ValueError):
+                _json.loads(b"{not json")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+"""`list-meetings` is the sidebar's data source, so its output is a contract.
+
+Electron parses the single JSON array it prints; order is newest-first by
+session_info.processed_at, and a single unreadable summary must never hide
+the rest of the list.
+"""
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from click.testing import CliRunner
+
+import simple_recorder
+from src.config import Config
+
+
+def _write_json_summary(output_dir, stem, processed_at, **extra):
+    data = {
+        "session_info": {"name": stem, "processed_at": processed_at},
+        "summary": f"summary of {stem}",
+        "participants": ["Alice"],
+        "transcript": "Alice: hello",
+        **extra,
+    }
+    path = Path(output_dir) / f"{stem}_summary.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return path
+
+
+def _list(tmp):
+    output_dir = Path(tmp) / "output"
+    dirs = {"recordings": Path(tmp) / "recordings",
+            "transcripts": Path(tmp) / "transcripts",
+            "output": output_dir}
+    cfg = Config(config_path=Path(tmp) / "config.json")
+    with mock.patch("src.config.get_data_dirs", return_value=dirs), \
+            mock.patch("src.config.get_config", return_value=cfg):
+        res = CliRunner().invoke(simple_recorder.list_meetings, [])
+    return res
+
+
+def _only_json(output):
+    lines = [line for line in output.splitlines() if line.startswith("[")]
+    assert len(lines) == 1, f"expected exactly one JSON line, got: {output!r}"
+    return json.loads(lines[0])
+
+
+class ListMeetingsTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = self._tmp.name
+        self.output_dir = Path(self.tmp) / "output"
+        self.output_dir.mkdir()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_empty_output_dir_lists_nothing(self):
+        res = _list(self.tmp)
+        self.assertEqual(res.exit_code, 0, res.output)
+        self.assertEqual(_only_json(res.output), [])
+
+    def test_newest_first_and_transcript_stripped(self):
+        # Enough files that the thread pool actually fans out, written in an
+        # order unrelated to processed_at.
+        stamps = [f"2026-01-{day:02d}T10:00:00" for day in (5, 1, 9, 3, 7, 2, 8, 4, 6)]
+        for i, stamp in enumerate(stamps):
+            _write_json_summary(self.output_dir, f"meeting{i}", stamp)
+
+        res = _list(self.tmp)
+        self.assertEqual(res.exit_code, 0, res.output)
+        meetings = _only_json(res.output)
+
+        got = [m["session_info"]["processed_at"] for m in meetings]
+        self.assertEqual(got, sorted(stamps, reverse=True))
+        for m in meetings:
+            self.assertNotIn("transcript", m)
+            self.assertTrue(m["has_transcript"])
+
+    def test_corrupt_summary_is_skipped_not_fatal(self):
+        _write_json_summary(self.output_dir, "good", "2026-01-01T10:00:00")
+        (self.output_dir / "bad_summary.json").write_text("{not json", encoding="utf-8")
+
+        res = _list(self.tmp)
+        self.assertEqual(res.exit_code, 0, res.output)
+        meetings = _only_json(res.output)
+        self.assertEqual([m["session_info"]["name"] for m in meetings], ["good"])
+
+    def test_unchanged_files_are_served_from_the_index(self):
+        a = _write_json_summary(self.output_dir, "a", "2026-01-01T10:00:00")
+        _write_json_summary(self.output_dir, "b", "2026-01-02T10:00:00")
+        first = _only_json(_list(self.tmp).output)
+        self.assertTrue((self.output_dir / simple_recorder._MEETING_INDEX_NAME).exists())
+
+        with mock.patch.object(simple_recorder, "_load_meeting_for_listing",
+                               wraps=simple_recorder._load_meeting_for_listing) as load:
+            second = _only_json(_list(self.tmp).output)
+            self.assertEqual(second, first)
+            load.assert_not_called()
+
+            # Rewriting one summary (size changes) re-parses exactly that file.
+            _write_json_summary(self.output_dir, "a", "2026-01-03T10:00:00",
+                                summary="a much longer summary than before")
+            third = _only_json(_list(self.tmp).output)
+            self.assertEqual(load.call_count, 1)
+            self.assertEqual(load.call_args[0][0], a)
+        self.assertEqual(third[0]["session_info"]["name"], "a")
+        self.assertEqual(third[0]["summary"], "a much longer summary than before")
+
+    def test_deleted_summary_drops_out_of_the_list(self):
+        _write_json_summary(self.output_dir, "keep", "2026-01-01T10:00:00")
+        gone = _write_json_summary(self.output_dir, "gone", "2026-01-02T10:00:00")
+        self.assertEqual(len(_only_json(_list(self.tmp).output)), 2)
+        gone.unlink()
+        meetings = _only_json(_list(self.tmp).output)
+        self.assertEqual([m["session_info"]["name"] for m in meetings], ["keep"])
+
+    def test_same_size_replace_with_unchanged_mtime_is_reparsed(self):
+        a = _write_json_summary(self.output_dir, "a", "2026-01-01T10:00:00", folders=["x"])
+        before = a.stat()
+        self.assertEqual(_only_json(_list(self.tmp).output)[0]["folders"], ["x"])
+
+        # A folder move rewrites the file at the same size; on a filesystem
+        # with coarse mtimes it also keeps the same mtime.
+        data = json.loads(a.read_text(encoding="utf-8"))
+        data["folders"] = ["y"]
+        simple_recorder._atomic_write_text(a, json.dumps(data))
+        os.utime(a, ns=(before.st_atime_ns, before.st_mtime_ns))
+        self.assertEqual(a.stat().st_size, before.st_size)
+
+        self.assertEqual(_only_json(_list(self.tmp).output)[0]["folders"], ["y"])
+
+    def test_index_drops_entries_for_deleted_summaries(self):
+        _write_json_summary(self.output_dir, "keep", "2026-01-01T10:00:00")
+        gone = _write_json_summary(self.output_dir, "gone", "2026-01-02T10:00:00")
+        _list(self.tmp)
+        gone.unlink()
+        _list(self.tmp)
+        index = json.loads((self.output_dir / simple_recorder._MEETING_INDEX_NAME)
+                           .read_text(encoding="utf-8"))
+        self.assertEqual(list(index["entries"]), [str(self.output_dir / "keep_summary.json")])
+
+    def test_corrupt_index_is_rebuilt(self):
+        _write_json_summary(self.output_dir, "a", "2026-01-01T10:00:00")
+        (self.output_dir / simple_recorder._MEETING_INDEX_NAME).write_text("{oops", encoding="utf-8")
+        meetings = _only_json(_list(self.tmp).output)
+        self.assertEqual([m["session_info"]["name"] for m in meetings], ["a"])
+
+
+if __name__ == "__main__":
+    unittest.main()
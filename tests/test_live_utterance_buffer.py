@@ -0,0 +1,125 @@
+"""The live pipeline's preallocated utterance buffer must be invisible.
+
+``_LiveVadPipeline`` accumulates each utterance into one reusable float32
+buffer instead of re-concatenating on every chunk. These tests pin that a
+finalised utterance still carries exactly preroll + speech audio in order, that
+the samples handed to the bleed coordinator survive the buffer being reused for
+the next utterance, and that an utterance longer than the initial capacity
+grows the buffer rather than overflowing it.
+"""
+
+import unittest
+
+try:
+    import numpy as np
+    _HAVE_NUMPY = True
+except ImportError:  # pragma: no cover - numpy is a hard backend dep
+    _HAVE_NUMPY = False
+
+from simple_recorder import _LiveVadPipeline
+
+
+class _SpeechStart:
+    pass
+
+
+class _SpeechEnd:
+    pass
+
+
+class _ScriptedVAD:
+    """Replays a fixed list of (events, in_speech) per process() call."""
+
+    def __init__(self, script):
+        self.script = list(script)
+        self.in_speech = False
+
+    def process(self, chunk):
+        events, self.in_speech = self.script.pop(0)
+        return events
+
+    def flush(self):
+        return []
+
+
+class _RecordingCoordinator:
+    def __init__(self):
+        self.added = []
+
+    def add(self, **kwargs):
+        self.added.append(kwargs)
+
+
+def _make_pipeline(vad, coordinator):
+    pipe = _LiveVadPipeline(
+        np=np,
+        vad=vad,
+        sr=16000,
+        SpeechStart=_SpeechStart,
+        SpeechEnd=_SpeechEnd,
+        transcribe_samples=lambda samples, language="auto": {"text": "hello there"},
+        speaker="You",
+        pending_finals=coordinator,
+        language="auto",
+    )
+    pipe._emit = lambda *a, **k: None
+    pipe._maybe_emit_partial = lambda: None
+    return pipe
+
+
+def _chunk(value, n=4000):
+    return np.full((n,), value, dtype=np.float32)
+
+
+@unittest.skipUnless(_HAVE_NUMPY, "numpy required for _LiveVadPipeline")
+class UtteranceBufferTests(unittest.TestCase):
+    def test_final_carries_preroll_then_speech_in_order(self):
+        vad = _ScriptedVAD([
+            ([], False),                 # preroll chunk 1
+            ([], False),                 # preroll chunk 2
+            ([_SpeechStart()], True),    # speech starts
+            ([], True),
+            ([_SpeechEnd()], False),     # speech ends (this chunk is not speech)
+        ])
+        coord = _RecordingCoordinator()
+        pipe = _make_pipeline(vad, coord)
+        for value in (1.0, 2.0, 3.0, 4.0, 5.0):
+            pipe.process(_chunk(value))
+
+        self.assertEqual(len(coord.added), 1)
+        got = coord.added[0]["samples"]
+        expected = np.concatenate([_chunk(1.0), _chunk(2.0), _chunk(3.0), _chunk(4.0)])
+        np.testing.assert_array_equal(got, expected)
+        self.assertEqual(len(pipe.speech_samples), 0)
+
+    def test_handed_off_samples_survive_buffer_reuse(self):
+        vad = _ScriptedVAD([
+            ([_SpeechStart()], True),
+            ([], True),
+            ([_SpeechEnd()], False),
+            ([_SpeechStart()], True),
+            ([], True),
+            ([_SpeechEnd()], False),
+        ])
+        coord = _RecordingCoordinator()
+        pipe = _make_pipeline(vad, coord)
+        pipe.PREROLL_CHUNKS = 0
+        for value in (1.0, 1.0, 0.0, 9.0, 9.0, 0.0):
+            pipe.process(_chunk(value))
+
+        self.assertEqual(len(coord.added), 2)
+        self.assertTrue(np.all(coord.added[0]["samples"] == 1.0))
+        self.assertTrue(np.all(coord.added[1]["samples"] == 9.0))
+
+    def test_buffer_grows_past_initial_capacity(self):
+        pipe = _make_pipeline(_ScriptedVAD([]), _RecordingCoordinator())
+        capacity = len(pipe._speech_buf)
+        big = np.arange(capacity + 123, dtype=np.float32)
+        pipe._append_speech(big[:capacity - 7])
+        pipe._append_speech(big[capacity - 7:])
+        self.assertGreater(len(pipe._speech_buf), capacity)
+        np.testing.assert_array_equal(pipe.speech_samples, big)
+
+
+if __name__ == "__main__":
+    unittest.main()
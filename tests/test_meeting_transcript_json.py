@@ -0,0 +1,54 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.models import ActionItem, Decision, DiscussionArea, MeetingTranscript
+
+
+def _transcript() -> MeetingTranscript:
+    return MeetingTranscript(
+        duration="12 minutes",
+        overview="Planning für Q3 — 会议",
+        participants=["Alice", "Bob"],
+        discussion_areas=[DiscussionArea(title="Roadmap", analysis="Scope agreed")],
+        key_points=[Decision(decision="Ship v2", context="Beta feedback")],
+        next_steps=[ActionItem(description="Write release notes", assignee="Bob")],
+        transcript="Alice: hello\nBob: hi",
+    )
+
+
+class MeetingTranscriptJsonFileTests(unittest.TestCase):
+    def test_round_trip_preserves_every_field(self):
+        original = _transcript()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "meeting.json"
+            original.to_json_file(str(path))
+            loaded = MeetingTranscript.from_json_file(str(path))
+        self.assertEqual(loaded, original)
+
+    def test_file_is_plain_indented_json(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "meeting.json"
+            _transcript().to_json_file(str(path))
+            text = path.read_text(encoding="utf-8")
+        self.assertIn('\n  "overview": ', text)
+        self.assertEqual(json.loads(text)["participants"], ["Alice", "Bob"])
+
+    def test_discussion_areas_default_is_per_instance(self):
+        fields = dict(duration="1m", overview="o", participants=[],
+                      key_points=[], next_steps=[], transcript="")
+        first, second = MeetingTranscript(**fields), MeetingTranscript(**fields)
+        first.discussion_areas.append(DiscussionArea(title="t", analysis="a"))
+        self.assertEqual(second.discussion_areas, [])
+
+    def test_invalid_file_raises(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "meeting.json"
+            path.write_text('{"overview": "missing required fields"}', encoding="utf-8")
+            with self.assertRaises(ValueError):
+                MeetingTranscript.from_json_file(str(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
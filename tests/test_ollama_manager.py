@@ -1,8 +1,10 @@
+import subprocess
 import tempfile
 import unittest
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
+from src import ollama_manager
 from src.ollama_manager import get_ollama_env
 
 
@@ -36,5 +38,152 @@ class GetOllamaEnvMLXMetalPathTests(unittest.TestCase):
         self.assertIn(str(bundled_dir), env["DYLD_LIBRARY_PATH"])
 
 
+class GetOllamaEnvServerDefaultsTests(unittest.TestCase):
+    def test_defaults_to_quantized_kv_cache(self):
+        with patch.dict("src.ollama_manager.os.environ", {}, clear=True), \
+             patch("src.ollama_manager.get_bundled_ollama_dir", return_value=None):
+            env = get_ollama_env()
+        self.assertEqual(env["OLLAMA_KV_CACHE_TYPE"], "q8_0")
+        self.assertEqual(env["OLLAMA_FLASH_ATTENTION"], "1")
+
+    def test_user_setting_wins(self):
+        with patch.dict("src.ollama_manager.os.environ",
+                        {"OLLAMA_KV_CACHE_TYPE": "f16", "OLLAMA_FLASH_ATTENTION": "0"}, clear=True), \
+             patch("src.ollama_manager.get_bundled_ollama_dir", return_value=None):
+            env = get_ollama_env()
+        self.assertEqual(env["OLLAMA_KV_CACHE_TYPE"], "f16")
+        self.assertEqual(env["OLLAMA_FLASH_ATTENTION"], "0")
+
+
+class GetBundledOllamaDirCacheTests(unittest.TestCase):
+    def setUp(self):
+        ollama_manager.get_bundled_ollama_dir.cache_clear()
+        self.addCleanup(ollama_manager.get_bundled_ollama_dir.cache_clear)
+
+    def test_bundle_probe_runs_once_per_process(self):
+        with patch("src.ollama_manager.Path.exists", return_value=False) as exists:
+            self.assertIsNone(ollama_manager.get_bundled_ollama_dir())
+            probes = exists.call_count
+            self.assertIsNone(ollama_manager.get_bundled_ollama_dir())
+            get_ollama_env()
+        self.assertGreater(probes, 0)
+        self.assertEqual(exists.call_count, probes)
+
+
+class IsOllamaRunningTests(unittest.TestCase):
+    def setUp(self):
+        ollama_manager._server_confirmed = False
+        self.addCleanup(setattr, ollama_manager, "_server_confirmed", False)
+
+    def test_closed_port_skips_http(self):
+        with patch("src.ollama_manager._ollama_port_open", return_value=False), \
+                patch("httpx.get") as http_get:
+            self.assertFalse(ollama_manager.is_ollama_running())
+        http_get.assert_not_called()
+
+    def test_open_port_is_confirmed_over_http(self):
+        with patch("src.ollama_manager._ollama_port_open", return_value=True), \
+                patch("httpx.get", return_value=Mock(status_code=200)) as http_get:
+            self.assertTrue(ollama_manager.is_ollama_running())
+        http_get.assert_called_once()
+
+    def test_confirmed_server_skips_http_while_port_stays_open(self):
+        with patch("src.ollama_manager._ollama_port_open", return_value=True), \
+                patch("httpx.get", return_value=Mock(status_code=200)) as http_get:
+            for _ in range(3):
+                self.assertTrue(ollama_manager.is_ollama_running())
+        http_get.assert_called_once()
+
+    def test_closed_port_forgets_the_confirmation(self):
+        with patch("httpx.get", return_value=Mock(status_code=200)) as http_get:
+            with patch("src.ollama_manager._ollama_port_open", return_value=True):
+                self.assertTrue(ollama_manager.is_ollama_running())
+            with patch("src.ollama_manager._ollama_port_open", return_value=False):
+                self.assertFalse(ollama_manager.is_ollama_running())
+            with patch("src.ollama_manager._ollama_port_open", return_value=True):
+                self.assertTrue(ollama_manager.is_ollama_running())
+        self.assertEqual(http_get.call_count, 2)
+
+    def test_non_ollama_listener_is_not_confirmed(self):
+        with patch("src.ollama_manager._ollama_port_open", return_value=True), \
+                patch("httpx.get", return_value=Mock(status_code=404)) as http_get:
+            self.assertFalse(ollama_manager.is_ollama_running())
+            self.assertFalse(ollama_manager.is_ollama_running())
+        self.assertEqual(http_get.call_count, 2)
+
+    def test_port_probe_against_a_closed_local_port(self):
+        import socket
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            free_port = sock.getsockname()[1]
+        with patch("src.ollama_manager._OLLAMA_PORT", free_port):
+            self.assertFalse(ollama_manager._ollama_port_open())
+
+
+class GetOllamaBinaryMemoTests(unittest.TestCase):
+    def setUp(self):
+        ollama_manager._resolved_ollama_binary = None
+        self.addCleanup(setattr, ollama_manager, "_resolved_ollama_binary", None)
+
+    def test_discovery_runs_once_per_process(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            binary = Path(tmp_dir) / "ollama"
+            binary.write_text("")
+            binary.chmod(0o755)
+            with patch("src.ollama_manager._discover_ollama_binary",
+                       return_value=binary) as discover:
+                self.assertEqual(ollama_manager.get_ollama_binary(), binary)
+                self.assertEqual(ollama_manager.get_ollama_binary(), binary)
+            discover.assert_called_once()
+
+    def test_vanished_binary_is_rediscovered(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            binary = Path(tmp_dir) / "ollama"
+            binary.write_text("")
+            binary.chmod(0o755)
+            with patch("src.ollama_manager._discover_ollama_binary",
+                       return_value=binary):
+                ollama_manager.get_ollama_binary()
+            binary.unlink()
+            with patch("src.ollama_manager._discover_ollama_binary",
+                       return_value=None) as discover:
+                self.assertIsNone(ollama_manager.get_ollama_binary())
+            discover.assert_called_once()
+
+    def test_not_found_is_not_cached(self):
+        with patch("src.ollama_manager._discover_ollama_binary",
+                   return_value=None) as discover:
+            ollama_manager.get_ollama_binary()
+            ollama_manager.get_ollama_binary()
+        self.assertEqual(discover.call_count, 2)
+
+
+class StartOllamaServerWaitTests(unittest.TestCase):
+    def _start(self, proc, running):
+        with patch("src.ollama_manager.is_ollama_running", side_effect=running), \
+                patch("src.ollama_manager.get_ollama_binary", return_value=Path("/x/ollama")), \
+                patch("src.ollama_manager.subprocess.Popen", return_value=proc), \
+                patch("src.ollama_manager._write_pid"), \
+                patch("src.ollama_manager._clear_pid") as clear_pid, \
+                patch("src.ollama_manager.time.sleep",
+                      side_effect=AssertionError("must not sleep-poll")):
+            return ollama_manager.start_ollama_server(wait=True, timeout=30), clear_pid
+
+    def test_returns_as_soon_as_server_process_dies(self):
+        proc = Mock(pid=1234, returncode=1)
+        proc.wait.return_value = 1
+        ok, clear_pid = self._start(proc, [False, False, False])
+        self.assertFalse(ok)
+        proc.wait.assert_called_once()
+        clear_pid.assert_called_once()
+
+    def test_waits_on_child_between_health_polls(self):
+        proc = Mock(pid=1234)
+        proc.wait.side_effect = subprocess.TimeoutExpired("ollama", 0.5)
+        ok, _ = self._start(proc, [False, False, False, True])
+        self.assertTrue(ok)
+        self.assertEqual(proc.wait.call_count, 2)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -292,6 +292,31 @@ class TranscribeWindowsHeartbeatTests(unittest.TestCase):
         self.assertEqual(self.beats, [(2, 2)])
 
 
+class SessionOptionsTests(unittest.TestCase):
+    """The ORT intra-op pool is capped below the core count so live
+    partials don't starve audio capture; older onnx-asr without a
+    ``sess_options`` parameter keeps ORT's defaults."""
+
+    def test_caps_intra_op_threads_when_supported(self):
+        from unittest.mock import patch
+
+        fake_ort = SimpleNamespace(SessionOptions=lambda: SimpleNamespace())
+
+        def load_model(model, *, quantization=None, sess_options=None, providers=None):
+            pass
+
+        with patch.dict("sys.modules", {"onnxruntime": fake_ort}):
+            opts = onnx_backend._session_options(load_model)
+        self.assertEqual(opts.intra_op_num_threads, onnx_backend._INTRA_OP_THREADS)
+        self.assertGreaterEqual(onnx_backend._INTRA_OP_THREADS, 1)
+
+    def test_none_when_load_model_has_no_sess_options(self):
+        def load_model(model, *, quantization=None, providers=None):
+            pass
+
+        self.assertIsNone(onnx_backend._session_options(load_model))
+
+
 class LoadWav16kMonoTests(unittest.TestCase):
     def _write_wav(self, path, samples_int16, n_channels, framerate):
         with wave.open(str(path), "wb") as wf:
@@ -307,6 +332,7 @@ class LoadWav16kMonoTests(unittest.TestCase):
             self._write_wav(path, data, n_channels=1, framerate=16000)
             out = onnx_backend._load_wav_16k_mono(path)
         self.assertEqual(out.shape[0], 4)
+        self.assertEqual(out.dtype, np.float32)
         self.assertAlmostEqual(float(out[1]), 0.5, places=3)
 
     def test_downmixes_stereo_to_mono(self):
@@ -317,6 +343,7 @@ class LoadWav16kMonoTests(unittest.TestCase):
             self._write_wav(path, data, n_channels=2, framerate=16000)
             out = onnx_backend._load_wav_16k_mono(path)
         self.assertEqual(out.shape[0], 2)
+        self.assertEqual(out.dtype, np.float32)
         self.assertAlmostEqual(float(out[0]), 0.25, places=3)
         self.assertAlmostEqual(float(out[1]), 0.25, places=3)
 
@@ -2,6 +2,7 @@ import json
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 from simple_recorder import _atomic_write_json
 
@@ -56,6 +57,15 @@ class AtomicWriteJsonTests(unittest.TestCase):
             ]
             self.assertEqual(stray_temps, [])
 
+    def test_unserialisable_payload_never_opens_a_temp_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            target = Path(tmp_dir) / "state.json"
+            with mock.patch("tempfile.NamedTemporaryFile") as named_temp:
+                with self.assertRaises(TypeError):
+                    _atomic_write_json(target, {"obj": object()})
+            named_temp.assert_not_called()
+            self.assertFalse(target.exists())
+
     def test_creates_parent_directory_if_missing(self):
         with tempfile.TemporaryDirectory() as tmp_dir:
             target = Path(tmp_dir) / "nested" / "deeper" / "state.json"
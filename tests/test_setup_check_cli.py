@@ -5,6 +5,9 @@ The Electron main process (startup-setup-check) parses this JSON instead of
 scraping emoji out of the human-readable report, so its schema is a contract.
 """
 import json
+import os
+import subprocess
+import tempfile
 import unittest
 from unittest.mock import patch
 from click.testing import CliRunner
@@ -82,6 +85,62 @@ class SetupCheckJsonTests(unittest.TestCase):
             res.output,
         )
 
+    def _ffmpeg_check(self, script):
+        """Run --json with a fake ffmpeg (``script``) as the only one on PATH.
+
+        Returns the ffmpeg check, the fake's directory and the commands exec'd.
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            fake = os.path.join(tmp, "ffmpeg")
+            with open(fake, "w") as fh:
+                fh.write(script)
+            os.chmod(fake, 0o755)
+            real_run = subprocess.run
+            launched = []
+
+            def run(cmd, *args, **kwargs):
+                launched.append(cmd)
+                return real_run(cmd, *args, **kwargs)
+
+            # Only the fake passes the stat check, so a real ffmpeg in
+            # Homebrew or /usr/bin stays out of the result.
+            with patch.dict(os.environ, {"PATH": tmp}), \
+                    patch("os.path.isfile", side_effect=lambda p: p == fake), \
+                    patch("subprocess.run", side_effect=run):
+                res = CliRunner().invoke(simple_recorder.setup_check, ["--json"])
+            self.assertEqual(res.exit_code, 0, res.output)
+            ffmpeg = next(c for c in _only_json(res.output)["checks"] if c["name"] == "ffmpeg")
+            return ffmpeg, tmp, launched
+
+    @unittest.skipIf(os.name == "nt", "shell-script stand-in for ffmpeg")
+    def test_ffmpeg_that_fails_to_run_is_not_reported(self):
+        """An executable file that can't run `ffmpeg -version` is a failure, not ✅."""
+        ffmpeg, tmp, _ = self._ffmpeg_check("#!/bin/sh\nexit 1\n")
+        self.assertEqual(ffmpeg["status"], "fail")
+        self.assertIn(tmp, ffmpeg["detail"])
+
+    @unittest.skipIf(os.name == "nt", "shell-script stand-in for ffmpeg")
+    def test_ffmpeg_is_launched_once_and_reported_with_its_path(self):
+        ffmpeg, tmp, launched = self._ffmpeg_check("#!/bin/sh\nexit 0\n")
+        self.assertEqual(ffmpeg["status"], "pass")
+        self.assertIn(tmp, ffmpeg["detail"])
+        self.assertEqual(launched, [[os.path.join(tmp, "ffmpeg"), "-version"]])
+
+    def test_dependency_checks_do_not_import_packages(self):
+        """Dependencies are located with find_spec, so their module init never runs."""
+        import sys
+        with patch.dict(sys.modules), \
+                patch("importlib.util.find_spec", return_value=object()) as find_spec:
+            sys.modules.pop("sounddevice", None)
+            res = CliRunner().invoke(simple_recorder.setup_check, ["--json"])
+            self.assertNotIn("sounddevice", sys.modules)
+        self.assertEqual(res.exit_code, 0, res.output)
+        probed = {c.args[0] for c in find_spec.call_args_list}
+        self.assertTrue({"sounddevice", "pywhispercpp", "ollama"} <= probed, probed)
+        checks = {c["name"]: c for c in _only_json(res.output)["checks"]}
+        self.assertEqual(checks["sounddevice"]["status"], "pass")
+        self.assertEqual(checks["whisper"]["detail"], "pywhispercpp (fast)")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -235,6 +235,30 @@ class PullModelCommandTests(unittest.TestCase):
         self.assertIn("verifying sha256 digest", lines)
 
 
+    def test_rapid_ticks_within_one_blob_are_throttled(self):
+        """Ticks of the same blob arriving faster than the UI can show them
+        are dropped; the blob's first and final ticks always get through."""
+        from simple_recorder import cli
+
+        runner = CliRunner()
+        progress_events = [
+            mock.Mock(status="pulling abc123", total=1000, completed=c)
+            for c in (10, 20, 30, 40, 1000)
+        ]
+        with mock.patch("src.ollama_manager.start_ollama_server", return_value=True), \
+             mock.patch("ollama.pull", return_value=iter(progress_events)), \
+             mock.patch("simple_recorder.time.monotonic", return_value=100.0):
+            result = runner.invoke(cli, ["pull-model", "gemma4:e2b-nvfp4"])
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        lines = result.output.strip().splitlines()
+        progress_lines = [line for line in lines if line.startswith("pulling")]
+        self.assertEqual(progress_lines, [
+            "pulling abc123 1% (10/1000) [Part 1]",
+            "pulling abc123 100% (1000/1000) [Part 1]",
+        ])
+
+
 class DeleteModelCommandTests(unittest.TestCase):
     def test_delete_model_success(self):
         from simple_recorder import cli
@@ -0,0 +1,44 @@
+"""Salvage path for a structured summary the model returned as broken JSON."""
+
+import unittest
+from unittest import mock
+
+from src.config import Config
+from src.summarizer import OllamaSummarizer, _RE_UNQUOTED_ARRAY_ITEM
+
+
+def _make_summarizer():
+    with mock.patch.object(OllamaSummarizer, "_ensure_ollama_ready", return_value=True):
+        return OllamaSummarizer(model_name="llama3.2:3b", ai_provider="local", config=Config())
+
+
+def _quote_bare_items(text):
+    return _RE_UNQUOTED_ARRAY_ITEM.sub(r'\1 "\2" \3', text)
+
+
+class UnquotedArrayItemTests(unittest.TestCase):
+    def test_quotes_a_bare_array_item(self):
+        self.assertEqual(_quote_bare_items('[Alice]'), '[ "Alice" ]')
+
+    def test_quotes_a_multi_word_item_without_its_padding(self):
+        self.assertEqual(_quote_bare_items('[ Alice Smith ]'), '[ "Alice Smith" ]')
+
+    def test_long_whitespace_run_does_not_backtrack(self):
+        # The old lazy pattern took minutes on this; the current one is linear.
+        text = "[" + " " * 5000 + "x"
+        self.assertEqual(_quote_bare_items(text), text)
+
+    def test_summary_with_bare_array_items_is_repaired(self):
+        s = _make_summarizer()
+        response = ('{"overview": "Planning", "participants": [Alice], '
+                    '"key_points": [], "next_steps": [], "discussion_areas": []}')
+        with mock.patch.object(s, "_ensure_ollama_ready"):
+            with mock.patch.object(s.client, "chat",
+                                   return_value={"message": {"content": response}}):
+                summary = s.summarize_transcript("Alice: let's plan", 5)
+        self.assertEqual(summary.overview, "Planning")
+        self.assertEqual(summary.participants, ["Alice"])
+
+
+if __name__ == "__main__":
+    unittest.main()
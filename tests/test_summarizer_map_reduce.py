@@ -1,10 +1,12 @@
 """Unit tests for map-reduce summarization helpers in OllamaSummarizer."""
 
+import os
 import unittest
 from unittest import mock
 
 from src.config import Config
 from src.summarizer import OllamaSummarizer, MAP_PROMPT_OVERHEAD_TOKENS, MAP_OUTPUT_MAX_TOKENS, CHARS_PER_TOKEN, _CHUNK_SAFETY_CHARS_PER_TOKEN
+from src.summarizer import SUMMARY_OUTPUT_MAX_TOKENS, _CONTEXT_TRUNCATION_MARKER, resolve_num_ctx
 
 
 def _make_summarizer(model_name="llama3.2:3b"):
@@ -105,6 +107,16 @@ class MapCallTests(unittest.TestCase):
         self.assertIn("ACTION ITEMS", prompt)
         self.assertIn("TRANSCRIPT SEGMENT:", prompt)
 
+    def test_map_prompts_share_a_static_prefix(self):
+        # The chunk position must come after the instructions so every map
+        # call starts with the same tokens (Ollama prompt-cache reuse).
+        s = _make_summarizer()
+        first = s._create_map_prompt("alpha", 1, 3)
+        third = s._create_map_prompt("gamma", 3, 3)
+        self.assertTrue(first.startswith("Extract only"))
+        shared = os.path.commonprefix([first, third])
+        self.assertIn("OPEN QUESTIONS", shared)
+
     def test_summarize_chunk_raises_on_empty_llm_response(self):
         s = _make_summarizer()
         with mock.patch.object(s, '_ensure_ollama_ready'):
@@ -135,6 +147,14 @@ class MapCallTests(unittest.TestCase):
             all_kwargs = dict(zip(['model', 'messages', 'stream', 'options'], mock_chat.call_args.args))
         self.assertEqual(all_kwargs.get('options', {}).get('num_predict'), 600)
 
+    def test_stream_direct_caps_output_tokens(self):
+        s = _make_summarizer()
+        with mock.patch.object(s, '_ensure_ollama_ready'):
+            with mock.patch.object(s.client, 'chat',
+                                   return_value=iter([{"message": {"content": "## Summary"}}])) as mock_chat:
+                self.assertEqual(list(s._stream_direct("prompt")), ["## Summary"])
+        self.assertEqual(mock_chat.call_args.kwargs["options"]["num_predict"], SUMMARY_OUTPUT_MAX_TOKENS)
+
     def test_summarize_chunk_uses_non_streaming(self):
         s = _make_summarizer()
         fake_response = {"message": {"content": "result"}}
@@ -147,6 +167,62 @@ class MapCallTests(unittest.TestCase):
         self.assertIs(call_kwargs.get('stream'), False)
 
 
+class MapConcurrencyTests(unittest.TestCase):
+    """_map_chunks follows OLLAMA_NUM_PARALLEL: sequential by default, fanned
+    out on a thread pool when the server is configured for parallel slots."""
+
+    def _run(self, env, chunks, side_effect):
+        import os
+        s = _make_summarizer()
+        ticks = []
+        with mock.patch.dict(os.environ, env), \
+                mock.patch.object(s, "_summarize_chunk", side_effect=side_effect):
+            results = s._map_chunks(chunks, lambda k, n: ticks.append((k, n)))
+        return results, ticks
+
+    def test_default_is_sequential_with_a_tick_per_chunk(self):
+        import os
+        env = {k: v for k, v in os.environ.items() if k != "OLLAMA_NUM_PARALLEL"}
+        with mock.patch.dict(os.environ, env, clear=True):
+            results, ticks = self._run({}, ["a", "b", "c"], lambda c, i, n: c.upper())
+        self.assertEqual(results, ["A", "B", "C"])
+        self.assertEqual(ticks, [(1, 3), (2, 3), (3, 3)])
+
+    def test_parallel_overlaps_calls_and_keeps_chunk_order(self):
+        import threading
+        import time
+        active, peak, lock = [0], [0], threading.Lock()
+
+        def slow(chunk, i, n):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05 * (4 - i))  # later chunks finish first
+            with lock:
+                active[0] -= 1
+            return chunk.upper()
+
+        results, ticks = self._run({"OLLAMA_NUM_PARALLEL": "3"}, ["a", "b", "c"], slow)
+        self.assertEqual(results, ["A", "B", "C"])
+        self.assertGreater(peak[0], 1)
+        self.assertEqual(ticks, [(1, 3), (2, 3), (3, 3)])
+
+    def test_parallel_failure_propagates(self):
+        def boom(chunk, i, n):
+            if i == 2:
+                raise ValueError("Chunk 2/3 returned an empty result after retry")
+            return chunk
+
+        with self.assertRaises(ValueError):
+            self._run({"OLLAMA_NUM_PARALLEL": "3"}, ["a", "b", "c"], boom)
+
+    def test_invalid_setting_falls_back_to_sequential(self):
+        from src.summarizer import _map_concurrency
+        import os
+        with mock.patch.dict(os.environ, {"OLLAMA_NUM_PARALLEL": "lots"}):
+            self.assertEqual(_map_concurrency(), 1)
+
+
 class ThinkingDisabledTests(unittest.TestCase):
     """Regression for STREAM_ERROR "empty result after retry" on thinking-capable
     models. gemma4:e2b-it-qat / gemma4:12b-it-qat emit chain-of-thought into
@@ -368,6 +444,50 @@ class NeedsChunkingTests(unittest.TestCase):
         self.assertTrue(s._needs_chunking(long_transcript))
 
 
+class FitToContextTests(unittest.TestCase):
+    def test_short_transcript_is_untouched(self):
+        s = _make_summarizer("llama3.2:3b")
+        text = "Alice: hi\n" * 100
+        self.assertIs(s._fit_to_context(text), text)
+
+    def test_long_transcript_keeps_head_and_tail_within_budget(self):
+        s = _make_summarizer("llama3.2:3b")
+        lines = [f"line {i:05d}: " + "x" * 40 for i in range(2000)]
+        text = "\n".join(lines)
+        fitted = s._fit_to_context(text)
+        budget = int(resolve_num_ctx("llama3.2:3b") * 0.8 * CHARS_PER_TOKEN)
+        self.assertLessEqual(len(fitted), budget + len(_CONTEXT_TRUNCATION_MARKER))
+        self.assertTrue(fitted.startswith("line 00000:"))
+        self.assertTrue(fitted.endswith(lines[-1]))
+        self.assertIn("omitted", fitted)
+        self.assertNotIn(lines[1000], fitted)
+        # Cuts fall on line boundaries.
+        before = fitted.split("[... middle")[0]
+        self.assertIn(before.rstrip("\n").rsplit("\n", 1)[-1], lines)
+
+    def test_notes_longer_than_the_context_leave_the_transcript_half(self):
+        s = _make_summarizer("llama3.2:3b")
+        budget = int(resolve_num_ctx("llama3.2:3b") * 0.8 * CHARS_PER_TOKEN)
+        lines = [f"line {i:05d}: " + "x" * 40 for i in range(2000)]
+        text = "\n".join(lines)
+        fitted = s._fit_to_context(text, notes="n" * (budget * 2))
+        self.assertTrue(fitted.startswith("line 00000:"))
+        self.assertTrue(fitted.endswith(lines[-1]))
+        # Head (30%) and tail (60%) of the transcript's half, less line rounding.
+        self.assertGreater(len(fitted), budget * 4 // 10)
+        self.assertLessEqual(len(fitted), budget // 2 + len(_CONTEXT_TRUNCATION_MARKER))
+
+    def test_transcript_that_fits_is_untouched_even_past_the_chunking_floor(self):
+        """_needs_chunking's 2 chars/token floor is a worst case for picking
+        map-reduce; a transcript that fits at the English estimate must not
+        lose its middle on the single-call paths."""
+        s = _make_summarizer("llama3.2:3b")
+        budget = int(resolve_num_ctx("llama3.2:3b") * 0.8 * CHARS_PER_TOKEN)
+        text = ("Alice: " + "y" * 70 + "\n") * (budget // 78)
+        self.assertTrue(s._needs_chunking(text))
+        self.assertIs(s._fit_to_context(text), text)
+
+
 class MapReduceStreamingTests(unittest.TestCase):
     def test_progress_callback_called_for_each_chunk_then_reducing(self):
         s = _make_summarizer()
@@ -0,0 +1,114 @@
+"""_ensure_ollama_ready() runs before every map/reduce call, so the installed-
+model listing behind it is memoized per summarizer for MODEL_CHECK_TTL_S, and
+retries reuse the summarizer's Ollama client instead of rebuilding it."""
+
+import unittest
+from unittest import mock
+
+from src.config import Config
+from src.summarizer import OllamaSummarizer
+
+
+def _make_summarizer(model="llama3.2:3b"):
+    with mock.patch.object(OllamaSummarizer, "_ensure_ollama_ready", return_value=True):
+        return OllamaSummarizer(model_name=model, ai_provider="local", config=Config())
+
+
+def _listing(*names):
+    return mock.Mock(models=[mock.Mock(model=n) for n in names])
+
+
+class ModelAvailabilityMemoTests(unittest.TestCase):
+    def test_repeat_checks_within_ttl_list_once(self):
+        s = _make_summarizer()
+        with mock.patch.object(s.client, "list",
+                        return_value=_listing("llama3.2:3b")) as listing:
+            for _ in range(5):
+                self.assertTrue(s._ensure_model_available())
+        listing.assert_called_once()
+
+    def test_expired_memo_lists_again(self):
+        s = _make_summarizer()
+        with mock.patch.object(s.client, "list",
+                        return_value=_listing("llama3.2:3b")) as listing, \
+                mock.patch("src.summarizer.time.monotonic", side_effect=[100.0, 100.0 + s.MODEL_CHECK_TTL_S + 1, 200.0]):
+            self.assertTrue(s._ensure_model_available())
+            self.assertTrue(s._ensure_model_available())
+        self.assertEqual(listing.call_count, 2)
+
+    def test_switching_model_misses_the_memo(self):
+        s = _make_summarizer()
+        with mock.patch.object(s.client, "list",
+                        return_value=_listing("llama3.2:3b", "qwen3.5:9b")) as listing:
+            self.assertTrue(s._ensure_model_available())
+            s.model_name = "qwen3.5:9b"
+            self.assertTrue(s._ensure_model_available())
+        self.assertEqual(listing.call_count, 2)
+
+    def test_failure_is_not_memoized(self):
+        s = _make_summarizer()
+        with mock.patch.object(s.client, "list", side_effect=ConnectionError("down")) as listing:
+            self.assertFalse(s._ensure_model_available())
+            self.assertFalse(s._ensure_model_available())
+        self.assertEqual(listing.call_count, 2)
+
+    def test_fallback_pulls_stop_once_the_server_is_unreachable(self):
+        s = _make_summarizer("not-a-real-model")
+        with mock.patch.object(s.client, "list", return_value=_listing()), \
+                mock.patch.object(s.client, "pull", side_effect=ConnectionError("down")) as pull:
+            self.assertFalse(s._ensure_model_available())
+        # The requested model, then one fallback before giving up.
+        self.assertEqual(pull.call_count, 2)
+
+    def test_fallback_pulls_skip_tags_the_server_rejects(self):
+        import ollama
+        s = _make_summarizer("not-a-real-model")
+        outcomes = [ollama.ResponseError("no such model"), ollama.ResponseError("nope"), None]
+        with mock.patch.object(s.client, "list", return_value=_listing()), \
+                mock.patch.object(s.client, "pull", side_effect=outcomes) as pull:
+            self.assertTrue(s._ensure_model_available())
+        self.assertEqual(pull.call_count, 3)
+        self.assertEqual(s.model_name, pull.call_args.args[0])
+
+
+class RetryReusesClientTests(unittest.TestCase):
+    def test_query_retry_keeps_the_same_client(self):
+        s = _make_summarizer()
+        client = mock.Mock()
+        client.chat.side_effect = [ConnectionError("reset"), {"message": {"content": " 42 "}}]
+        s.client = client
+        with mock.patch.object(s, "_ensure_ollama_ready"), \
+                mock.patch("src.summarizer.time.sleep"), \
+                mock.patch("src.summarizer.ollama.Client") as new_client:
+            self.assertEqual(s.query_transcript("Alice: hi", "answer?"), "42")
+        self.assertIs(s.client, client)
+        self.assertEqual(client.chat.call_count, 2)
+        new_client.assert_not_called()
+
+    def test_retry_skips_readiness_check_while_server_is_up(self):
+        s = _make_summarizer()
+        client = mock.Mock()
+        client.chat.side_effect = [ConnectionError("reset"), {"message": {"content": "ok"}}]
+        s.client = client
+        with mock.patch.object(s, "_ensure_ollama_ready") as ready, \
+                mock.patch.object(s, "_is_ollama_running", return_value=True), \
+                mock.patch("src.summarizer.time.sleep") as sleep:
+            self.assertEqual(s.query_transcript("Alice: hi", "answer?"), "ok")
+        sleep.assert_called_once()
+        self.assertTrue(0.5 <= sleep.call_args.args[0] <= 1)
+        ready.assert_not_called()
+
+    def test_retry_restarts_a_server_that_went_away(self):
+        s = _make_summarizer()
+        client = mock.Mock()
+        client.chat.side_effect = [ConnectionError("refused"), {"message": {"content": "ok"}}]
+        s.client = client
+        with mock.patch.object(s, "_ensure_ollama_ready") as ready, \
+                mock.patch.object(s, "_is_ollama_running", return_value=False), \
+                mock.patch("src.summarizer.time.sleep"):
+            self.assertEqual(s.query_transcript("Alice: hi", "answer?"), "ok")
+        ready.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
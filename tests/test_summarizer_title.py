@@ -22,7 +22,7 @@ def _title_from(raw: str):
     s.ai_provider = "local"
     s.model_name = "deepseek-r1:8b"
     s.remote_url = None
-    s.ollama_process = None  # let __del__/cleanup no-op quietly (we bypassed __init__)
+    s.ollama_process = None  # let cleanup no-op quietly (we bypassed __init__)
     with mock.patch.object(s, "_chat_no_think", return_value={"message": {"content": raw}}), \
             mock.patch.object(s, "_ollama_options", return_value={}), \
             mock.patch.object(s, "_ensure_ollama_ready", return_value=None), \
@@ -118,5 +118,177 @@ class WhisperTranscriberShimTests(unittest.TestCase):
         self.assertFalse(info["openai_whisper_available"])
 
 
+class WhisperCppImportTests(unittest.TestCase):
+    """pywhispercpp is only located (find_spec) at module import; the real
+    import is deferred to model load, so a native-library failure there
+    must still fall back to Parakeet like a missing package did."""
+
+    def test_broken_pywhispercpp_falls_back_to_parakeet(self):
+        from unittest.mock import Mock
+
+        from src import transcriber as transcriber_mod
+
+        cfg = Mock()
+        cfg.get_transcription_engine.return_value = "whisper"
+        with patch.object(transcriber_mod, "WHISPER_CPP_AVAILABLE", True), \
+             patch.object(transcriber_mod, "PARAKEET_AVAILABLE", True), \
+             patch("src.config.get_config", return_value=cfg), \
+             patch.object(WhisperTranscriber, "_load_whisper_cpp",
+                          side_effect=ImportError("dlopen failed")), \
+             patch.object(WhisperTranscriber, "_ensure_ffmpeg_in_path"):
+            transcriber = WhisperTranscriber()
+        self.assertEqual(transcriber.backend, "parakeet-tdt-v3")
+
+    def test_module_import_does_not_load_pywhispercpp(self):
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, src.transcriber; "
+            "sys.exit(int('pywhispercpp.model' in sys.modules))"
+        )
+        proc = subprocess.run([sys.executable, "-c", code],
+                              cwd=str(Path(__file__).resolve().parent.parent))
+        self.assertEqual(proc.returncode, 0)
+
+
+class WhisperCppBackgroundLoadTests(unittest.TestCase):
+    """Engine selection starts the ggml load on a worker thread so it
+    overlaps the ffmpeg work before the first decode; the decode joins it."""
+
+    def _construct(self, model_cls):
+        import sys
+        import types
+        from unittest.mock import Mock
+
+        from src import transcriber as transcriber_mod
+
+        fake_model_mod = types.ModuleType("pywhispercpp.model")
+        fake_model_mod.Model = model_cls
+        cfg = Mock()
+        cfg.get_transcription_engine.return_value = "whisper"
+        with patch.dict(sys.modules, {"pywhispercpp": types.ModuleType("pywhispercpp"),
+                                      "pywhispercpp.model": fake_model_mod}), \
+             patch.object(transcriber_mod, "WHISPER_CPP_AVAILABLE", True), \
+             patch("src.config.get_config", return_value=cfg), \
+             patch.object(WhisperTranscriber, "_ensure_ffmpeg_in_path"):
+            return WhisperTranscriber()
+
+    def test_init_returns_before_the_model_loads(self):
+        import threading
+
+        release = threading.Event()
+
+        class SlowModel:
+            def __init__(self, model_size, n_threads):
+                release.wait(5)
+
+        transcriber = self._construct(SlowModel)
+        self.assertEqual(transcriber.backend, "whisper.cpp")
+        self.assertIsNone(transcriber.model)
+        release.set()
+        transcriber._await_model()
+        self.assertIsInstance(transcriber.model, SlowModel)
+
+    def test_load_failure_surfaces_at_first_decode(self):
+        class BrokenModel:
+            def __init__(self, model_size, n_threads):
+                raise RuntimeError("download failed")
+
+        transcriber = self._construct(BrokenModel)
+        with self.assertRaisesRegex(RuntimeError, "download failed"):
+            transcriber._run_whisper_cpp(Path("/nonexistent.wav"), language="en")
+
+
+    def test_cli_test_command_reports_a_failed_load(self):
+        from click.testing import CliRunner
+
+        import simple_recorder
+
+        class BrokenModel:
+            def __init__(self, model_size, n_threads):
+                raise RuntimeError("download failed")
+
+        transcriber = self._construct(BrokenModel)
+        with patch.object(simple_recorder, "WhisperTranscriber", return_value=transcriber):
+            res = CliRunner().invoke(simple_recorder.test, [])
+        self.assertIn("Whisper initialization failed: download failed", res.output)
+        self.assertNotIn("Whisper transcriber ready", res.output)
+
+
+class WhisperCppRunTests(unittest.TestCase):
+    """``_run_whisper_cpp`` against a fake pywhispercpp model. Decode settings
+    are pinned, but only the keys the installed pywhispercpp accepts — an
+    unknown key raises mid-decode."""
+
+    def _run(self, param_names, segments=()):
+        import tempfile
+        import wave
+        from types import SimpleNamespace
+
+        from src import transcriber as transcriber_mod
+
+        seen = {}
+
+        def fake_transcribe(media=None, **params):
+            seen.update(params)
+            self.media = media
+            return list(segments)
+
+        transcriber = WhisperTranscriber.__new__(WhisperTranscriber)
+        transcriber.model = SimpleNamespace(transcribe=fake_transcribe)
+        transcriber.model_size = "large-v3-turbo"
+        transcriber.backend = "whisper.cpp"
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            audio = Path(tmp_dir) / "audio.wav"
+            with wave.open(str(audio), "wb") as wf:
+                wf.setnchannels(1)
+                wf.setsampwidth(2)
+                wf.setframerate(16000)
+                wf.writeframes(b"\x00\x40" * 16000)
+            with patch.object(transcriber_mod, "_whisper_cpp_param_names", return_value=param_names):
+                self.result = transcriber._run_whisper_cpp(audio, language="en")
+        return seen
+
+    def test_known_params_are_forwarded(self):
+        seen = self._run(frozenset({"no_context", "greedy", "language"}))
+        self.assertEqual(seen["language"], "en")
+        self.assertIs(seen["no_context"], True)
+        self.assertEqual(seen["greedy"], {"best_of": 1})
+
+    def test_unknown_params_are_dropped(self):
+        seen = self._run(frozenset({"language"}))
+        self.assertEqual(seen, {"language": "en"})
+
+    def test_16khz_mono_wav_is_passed_as_samples(self):
+        """pywhispercpp re-decodes a path through its own ffmpeg; an
+        already-16 kHz mono WAV goes in as float32 samples instead."""
+        try:
+            import numpy as np
+        except ImportError:
+            self.skipTest("numpy required")
+        self._run(frozenset())
+        self.assertIsInstance(self.media, np.ndarray)
+        self.assertEqual(self.media.dtype, np.float32)
+        self.assertEqual(len(self.media), 16000)
+        self.assertTrue(np.all(self.media == 0.5))
+
+    def test_segments_are_stripped_deduped_and_joined(self):
+        from types import SimpleNamespace
+
+        def seg(text, t0):
+            return SimpleNamespace(text=text, t0=t0, t1=t0 + 50)
+
+        segments = [seg(" Hello there. ", 0), seg("  ", 50)]
+        segments += [seg(" Thank you.", 100 + 50 * i) for i in range(5)]
+        segments += [seg("Bye now. ", 400)]
+        self._run(frozenset(), segments)
+        self.assertEqual(self.result["text"], "Hello there. Bye now.")
+        self.assertEqual(self.result["segments"], [
+            {"text": "Hello there.", "start": 0.0, "end": 0.5},
+            {"text": "Bye now.", "start": 4.0, "end": 4.5},
+        ])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -320,6 +320,28 @@ class ResolveFfmpegTests(unittest.TestCase):
         result = _resolve_ffmpeg()
         self.assertTrue(result is None or isinstance(result, str))
 
+    def test_ensure_in_path_reuses_the_cached_resolve(self):
+        """A second transcriber in the same process must not re-probe every
+        ffmpeg candidate with a ``-version`` subprocess."""
+        import os
+        from unittest.mock import patch
+
+        from src import transcriber as transcriber_mod
+
+        fake_dir = os.path.join(tempfile.gettempdir(), "stenoai-fake-ffmpeg-bin")
+        fake = os.path.join(fake_dir, "ffmpeg")
+        ok = Mock(returncode=0)
+        with patch.object(transcriber_mod, "_FFMPEG_PATH_CACHE", None), \
+             patch("shutil.which", return_value=fake), \
+             patch.object(transcriber_mod.subprocess, "run", return_value=ok) as run_mock, \
+             patch.dict(os.environ, {"PATH": "/usr/bin"}):
+            transcriber = WhisperTranscriber.__new__(WhisperTranscriber)
+            transcriber._ensure_ffmpeg_in_path()
+            transcriber._ensure_ffmpeg_in_path()
+            path = os.environ["PATH"]
+        self.assertEqual(run_mock.call_count, 1)
+        self.assertEqual(path.split(os.pathsep), [fake_dir, "/usr/bin"])
+
 
 class DiarisedSplitTimeoutTests(unittest.TestCase):
     """The per-channel split timeout must scale with recording length so a